@@ -1,9 +1,8 @@
 
 import sys
-import os
 import json
 import re
-import tempfile
+import threading
 from collections import Counter
 import networkx as nx
 import matplotlib.pyplot as plt
@@ -23,8 +22,22 @@ from wordcloud import WordCloud
 import arabic_reshaper
 from bidi.algorithm import get_display
 import colorsys
-import sqlite3
-from gtts import gTTS
+
+from utils.favori_deposu import FavoriDeposu
+from utils.arka_plan_isleri import ArkaPlanIsleri
+from utils.benzer_ayetler import BenzerAyetMotoru
+from utils.grafik_onbellegi import GrafikOnbellegi
+from utils.kok_birliktelik import KokBirliktelikMatrisi, AYET, SURE
+from utils.metin_bolucu import ses_parcalari
+from utils.ses_onbellegi import SesOnbellegi
+from utils.sonek_dizisi import SonekDizisi
+from utils.sozluk_deposu import SozlukDeposu
+from utils.tts_motorlari import MOTORLAR, motor_olustur, uygun_motor_olustur, kullanilabilir_motorlar
+
+
+# Kelime bulutu boyutu ve yerleşim tohumu: önbellek isabetleri yeni çizimle aynı olur
+WORDCLOUD_SIZE = (800, 400)
+LAYOUT_SEED = 42
 
 
 class QuranAnalyzerApp(QMainWindow):
@@ -37,14 +50,25 @@ class QuranAnalyzerApp(QMainWindow):
         self.load_data()
 
         # Favorileri yükle
-        self.favorites = self.load_favorites()
+        self.favorites = FavoriDeposu()
 
         # Sözlük veritabanını aç
         self.dict_db_path = 'sozluk_veritabani.db'   # aynı klasörde
-        self._init_dictionary_db()
+        self.sozluk = SozlukDeposu(self.dict_db_path)
 
-        # Ses oynatıcı
+        # Ses oynatıcı ve kalıcı ses önbelleği
         self.player = QMediaPlayer(None)
+        self.ses_onbellegi = SesOnbellegi()
+        self.tts_motoru = uygun_motor_olustur()
+
+        # Kavram ağı ve kelime bulutu arka planda hesaplanır, sonuçlar önbelleğe yazılır
+        self.figure_cache = GrafikOnbellegi()
+        self.cooccurrence = {}  # pencere -> KokBirliktelikMatrisi, ilk kullanımda kurulur
+        self._cooccurrence_lock = threading.Lock()
+        self.figure_jobs = ArkaPlanIsleri(self)
+        self.figure_jobs.hazir.connect(self._figure_ready)
+        self.figure_jobs.hata.connect(
+            lambda tur, baglam, mesaj: self.statusBar().showMessage(f"Grafik oluşturulamadı: {mesaj}"))
 
         # GUI bileşenlerini oluştur
         self.init_ui()
@@ -69,6 +93,17 @@ class QuranAnalyzerApp(QMainWindow):
         self.word_index = {(w['sureNo'], w['ayetNo'], w['kelimeNo']): w for w in self.word_data}
         self.verse_index = {(v['sure'], v['ayet']): v for v in self.verse_data}
 
+        # Gezinme tablosu: genel sıra no ↔ (sure, ayet); önceki/sonraki ayet O(1)
+        self.verse_order = sorted(self.verse_index)
+        self.verse_ordinal = {anahtar: i for i, anahtar in enumerate(self.verse_order)}
+
+        # Ayet → kelimeler (kelimeNo sırasıyla); detay, istatistik ve ağ görünümleri paylaşır
+        self.verse_words = {}
+        for w in self.word_data:
+            self.verse_words.setdefault((w['sureNo'], w['ayetNo']), []).append(w)
+        for kelimeler in self.verse_words.values():
+            kelimeler.sort(key=lambda x: x['kelimeNo'])
+
         self.root_index = {}
         for w in self.word_data:
             root = (w.get('kok') or '').strip()
@@ -88,33 +123,12 @@ class QuranAnalyzerApp(QMainWindow):
             if ar:
                 self.arabic_index.setdefault(ar, []).append(w)
 
-    # -------------------- Sözlük DB --------------------
-    def _init_dictionary_db(self):
-        self.dict_conn = sqlite3.connect(self.dict_db_path)
-        cur = self.dict_conn.cursor()
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS entries(
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                kelime  TEXT UNIQUE,
-                telaffuz TEXT,
-                koken    TEXT,
-                anlam    TEXT,
-                ornek    TEXT
-            )
-        """)
-        self.dict_conn.commit()
+        # Kök TF-IDF vektörleri ve ters dizin: sıralı "Benzer Ayetler"
+        self.similar_verses = BenzerAyetMotoru(self.word_data)
 
-    # -------------------- Favoriler --------------------
-    def load_favorites(self):
-        try:
-            with open('favorites.json', 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            return []
-
-    def save_favorites(self):
-        with open('favorites.json', 'w', encoding='utf-8') as f:
-            json.dump(self.favorites, f, ensure_ascii=False, indent=2)
+        # Alt dize aramaları için dağarcık üzerinde sonek dizileri
+        self.turkish_suffixes = SonekDizisi(self.turkish_index)
+        self.arabic_suffixes = SonekDizisi(self.arabic_index)
 
     # -------------------- UI --------------------
     def init_ui(self):
@@ -151,6 +165,27 @@ class QuranAnalyzerApp(QMainWindow):
 
         left_layout.addWidget(search_group)
 
+        sozluk_group = QGroupBox("Sözlük")
+        sozluk_layout = QVBoxLayout(sozluk_group)
+        self.sozluk_arama = QLineEdit()
+        self.sozluk_arama.setPlaceholderText("Sözlükte ara (kelime veya anlam)...")
+        self.sozluk_arama.returnPressed.connect(self.sozluk_ara)
+        sozluk_layout.addWidget(self.sozluk_arama)
+        self.sozluk_sonuclari = QListWidget()
+        self.sozluk_sonuclari.setMaximumHeight(160)
+        self.sozluk_sonuclari.itemDoubleClicked.connect(
+            lambda item: self._show_dictionary_popup(item.data(Qt.UserRole), None))
+        sozluk_layout.addWidget(self.sozluk_sonuclari)
+        sozluk_butonlar = QHBoxLayout()
+        sozluk_ice_btn = QPushButton("İçe Aktar")
+        sozluk_ice_btn.clicked.connect(self.sozluk_ice_aktar)
+        sozluk_butonlar.addWidget(sozluk_ice_btn)
+        sozluk_disa_btn = QPushButton("Dışa Aktar")
+        sozluk_disa_btn.clicked.connect(self.sozluk_disa_aktar)
+        sozluk_butonlar.addWidget(sozluk_disa_btn)
+        sozluk_layout.addLayout(sozluk_butonlar)
+        left_layout.addWidget(sozluk_group)
+
         self.results_list = QListWidget()
         self.results_list.itemClicked.connect(self.show_verse_details)
         left_layout.addWidget(self.results_list)
@@ -184,6 +219,16 @@ class QuranAnalyzerApp(QMainWindow):
         self.tts_button.clicked.connect(self.play_current_verse_audio)
         context_buttons.addWidget(self.tts_button)
 
+        self.tts_engine_combo = QComboBox()
+        for ad in kullanilabilir_motorlar():
+            self.tts_engine_combo.addItem(MOTORLAR[ad].etiket, ad)
+        idx = self.tts_engine_combo.findData(self.tts_motoru.ad)
+        if idx >= 0:
+            self.tts_engine_combo.setCurrentIndex(idx)
+        self.tts_engine_combo.currentIndexChanged.connect(
+            lambda i: setattr(self, 'tts_motoru', motor_olustur(self.tts_engine_combo.itemData(i))))
+        context_buttons.addWidget(self.tts_engine_combo)
+
         self.next_button = QPushButton("Sonraki Ayet")
         self.next_button.clicked.connect(self.show_next_verse)
         context_buttons.addWidget(self.next_button)
@@ -206,6 +251,19 @@ class QuranAnalyzerApp(QMainWindow):
         # Kavram Ağı
         self.network_tab = QWidget()
         network_layout = QVBoxLayout(self.network_tab)
+        network_options = QHBoxLayout()
+        network_options.addWidget(QLabel("Birlikte geçme:"))
+        self.network_window = QComboBox()
+        self.network_window.addItem("Aynı ayet", AYET)
+        self.network_window.addItem("Aynı sure", SURE)
+        self.network_window.addItem("5 kelimelik pencere", 5)
+        self.network_window.currentIndexChanged.connect(self._refresh_network)
+        network_options.addWidget(self.network_window)
+        self.root_network_input = QLineEdit()
+        self.root_network_input.setPlaceholderText("Kök ağı (örn: ع ل م)")
+        self.root_network_input.returnPressed.connect(self._refresh_network)
+        network_options.addWidget(self.root_network_input)
+        network_layout.addLayout(network_options)
         self.network_canvas = FigureCanvas(plt.figure())
         network_layout.addWidget(self.network_canvas)
         self.tabs.addTab(self.network_tab, "Kavram Ağı")
@@ -230,43 +288,50 @@ class QuranAnalyzerApp(QMainWindow):
     # -------------------- Tooltip --------------------
     def _ensure_tooltip_store(self):
         if not hasattr(self, "kelime_tooltips"):
-            self.kelime_tooltips = {}
+            self.kelime_tooltips = {}  # (sure, ayet, kelimeNo) -> ipucu, ilk üzerine gelişte üretilir
+
+    @staticmethod
+    def _kelime_adresi(url):
+        """kelime:s/a/k (veya eski kelime://s/a/k) bağlantısını (s, a, k) demetine çevirir"""
+        u = url if isinstance(url, QUrl) else QUrl(str(url))
+        if u.scheme() != "kelime":
+            return None
+
+        # Öncelik: kelime:s/a/k (host yok)
+        parts = [p for p in u.path().split("/") if p]   # "s/a/k" veya "a/k"
+        if len(parts) != 3:
+            # Eski stil: kelime://s/a/k → host=s, path="/a/k"
+            parts = [u.host()] + parts
+        if len(parts) == 3 and all(p.isdigit() for p in parts):
+            return tuple(map(int, parts))
+        return None
+
+    def _kelime_ipucu(self, anahtar):
+        tip = self.kelime_tooltips.get(anahtar)
+        if tip is None:
+            w = self.word_index.get(anahtar)
+            if not w:
+                return ""
+            tip = (f"Arapça: {w.get('arapca') or '-'}\n"
+                   f"Kök: {(w.get('kok') or '').strip() or '-'}\n"
+                   f"Anlam: {w.get('turkce') or '-'}")
+            self.kelime_tooltips[anahtar] = tip
+        return tip
 
     def _on_anchor_hover(self, url):
         s = url.toString() if hasattr(url, "toString") else str(url)
         if not s:
             QToolTip.hideText(); return
-        tip = self.kelime_tooltips.get(s, "")
+        anahtar = self._kelime_adresi(url)
+        tip = self._kelime_ipucu(anahtar) if anahtar else ""
         if tip:
             QToolTip.showText(QCursor.pos(), tip)
 
     # -------------------- Tıkla → Sözlük --------------------
     def _on_anchor_clicked(self, url):
         try:
-            u = url if isinstance(url, QUrl) else QUrl(str(url))
-            if u.scheme() != "kelime":
-                return
-
-            # Öncelik: kelime:s/a/k (host yok)
-            path = u.path().lstrip("/")           # "s/a/k" veya "a/k"
-            parts = [p for p in path.split("/") if p]
-
-            if len(parts) == 3 and all(p.isdigit() for p in parts):
-                sure, ayet, kelime_no = map(int, parts)
-            else:
-                # Eski stil: kelime://s/a/k → host=s, path="/a/k"
-                host = u.host()
-                if host.isdigit():
-                    parts2 = [host] + [p for p in path.split("/") if p]
-                    if len(parts2) == 3 and all(p.isdigit() for p in parts2):
-                        sure, ayet, kelime_no = map(int, parts2)
-                    else:
-                        return
-                else:
-                    return
-
-            w = next((x for x in self.word_data
-                      if x['sureNo'] == sure and x['ayetNo'] == ayet and x['kelimeNo'] == kelime_no), None)
+            anahtar = self._kelime_adresi(url)
+            w = self.word_index.get(anahtar) if anahtar else None
             if not w:
                 return
             kel = (w.get('turkce') or '').strip()
@@ -276,12 +341,41 @@ class QuranAnalyzerApp(QMainWindow):
             QMessageBox.warning(self, "Hata", f"Tıklama işlenemedi:\n{e}")
 
     def _fetch_dict_entry(self, kelime):
-        cur = self.dict_conn.cursor()
-        cur.execute("SELECT kelime,telaffuz,koken,anlam,ornek FROM entries WHERE kelime=?", (kelime,))
-        row = cur.fetchone()
-        if row:
-            return {"kelime":row[0], "telaffuz":row[1], "koken":row[2], "anlam":row[3], "ornek":row[4]}
-        return None
+        return self.sozluk.getir(kelime)
+
+    def sozluk_ara(self):
+        """Sözlük kayıtlarını tam metin dizininde arar, en ilgili kayıtlar üstte"""
+        self.sozluk_sonuclari.clear()
+        sonuclar = self.sozluk.ara(self.sozluk_arama.text())
+        for kayit in sonuclar:
+            ozet = re.sub(r'</?b>', '', kayit['ozet'] or '')
+            item = QListWidgetItem(f"{kayit['kelime']} — {ozet}")
+            item.setData(Qt.UserRole, kayit['kelime'])
+            item.setToolTip(kayit['anlam'] or '')
+            self.sozluk_sonuclari.addItem(item)
+        self.statusBar().showMessage(f"Sözlükte {len(sonuclar)} kayıt bulundu")
+
+    def sozluk_ice_aktar(self):
+        yol, _ = QFileDialog.getOpenFileName(self, "Sözlük İçe Aktar", "",
+                                             "Sözlük dosyaları (*.csv *.json)")
+        if not yol:
+            return
+        try:
+            adet = self.sozluk.ice_aktar(yol)
+            QMessageBox.information(self, "Sözlük", f"{adet} kayıt içe aktarıldı.")
+        except Exception as e:
+            QMessageBox.critical(self, "Hata", f"İçe aktarma başarısız:\n{e}")
+
+    def sozluk_disa_aktar(self):
+        yol, _ = QFileDialog.getSaveFileName(self, "Sözlük Dışa Aktar", "sozluk.csv",
+                                             "CSV (*.csv);;JSON (*.json)")
+        if not yol:
+            return
+        try:
+            adet = self.sozluk.disa_aktar(yol)
+            QMessageBox.information(self, "Sözlük", f"{adet} kayıt dışa aktarıldı.")
+        except Exception as e:
+            QMessageBox.critical(self, "Hata", f"Dışa aktarma başarısız:\n{e}")
 
     def _show_dictionary_popup(self, kelime, word_data):
         data = self._fetch_dict_entry(kelime)
@@ -342,12 +436,7 @@ class QuranAnalyzerApp(QMainWindow):
                 return
 
             try:
-                cur = self.dict_conn.cursor()
-                cur.execute("""
-                    INSERT OR REPLACE INTO entries(kelime,telaffuz,koken,anlam,ornek)
-                    VALUES(?,?,?,?,?)
-                """, (kelime, telaffuz, koken, anlam, ornek))
-                self.dict_conn.commit()
+                self.sozluk.kaydet(kelime, telaffuz, koken, anlam, ornek)
                 QMessageBox.information(dlg, "Başarılı", "Kayıt eklendi/güncellendi.")
                 dlg.accept()
             except Exception as e:
@@ -380,64 +469,42 @@ class QuranAnalyzerApp(QMainWindow):
         else:
             self.search_general(query)
 
-    def search_by_sure_ayet(self, sure, ayet):
-        for verse in self.verse_data:
-            if verse['sure'] == sure and verse['ayet'] == ayet:
-                it = QListWidgetItem(f"{sure}/{ayet} - {verse['turkce'][:50]}...")
-                it.setData(Qt.UserRole, (sure, ayet))
-                self.results_list.addItem(it)
-                break
-
-    def search_by_root(self, root):
-        if root in self.root_index:
-            verses = {(w['sureNo'], w['ayetNo']) for w in self.root_index[root]}
+    def _add_results(self, verses):
+        """(sure, ayet) anahtarlarını sıralı olarak sonuç listesine tek seferde ekler"""
+        self.results_list.setUpdatesEnabled(False)
+        try:
             for s, a in sorted(verses):
                 v = self.verse_index.get((s, a))
                 if v:
                     it = QListWidgetItem(f"{s}/{a} - {v['turkce'][:50]}...")
                     it.setData(Qt.UserRole, (s, a))
                     self.results_list.addItem(it)
+        finally:
+            self.results_list.setUpdatesEnabled(True)
+
+    def _verses_of(self, index, keys):
+        return {(w['sureNo'], w['ayetNo']) for key in keys for w in index[key]}
+
+    def search_by_sure_ayet(self, sure, ayet):
+        if (sure, ayet) in self.verse_index:
+            self._add_results([(sure, ayet)])
+
+    def search_by_root(self, root):
+        if root in self.root_index:
+            self._add_results(self._verses_of(self.root_index, [root]))
 
     def search_arabic(self, query):
-        for ar, words in self.arabic_index.items():
-            if query in ar:
-                verses = {(w['sureNo'], w['ayetNo']) for w in words}
-                for s, a in sorted(verses):
-                    v = self.verse_index.get((s, a))
-                    if v:
-                        it = QListWidgetItem(f"{s}/{a} - {v['turkce'][:50]}...")
-                        it.setData(Qt.UserRole, (s, a))
-                        self.results_list.addItem(it)
+        self._add_results(self._verses_of(self.arabic_index, self.arabic_suffixes.icerenler(query)))
 
     def search_turkish(self, query):
         query = query.lower()
-        for tr, words in self.turkish_index.items():
-            if query in tr:
-                verses = {(w['sureNo'], w['ayetNo']) for w in words}
-                for s, a in sorted(verses):
-                    v = self.verse_index.get((s, a))
-                    if v:
-                        it = QListWidgetItem(f"{s}/{a} - {v['turkce'][:50]}...")
-                        it.setData(Qt.UserRole, (s, a))
-                        self.results_list.addItem(it)
+        self._add_results(self._verses_of(self.turkish_index, self.turkish_suffixes.icerenler(query)))
 
     def search_general(self, query):
         query = query.lower()
-        found = set()
-        for tr, words in self.turkish_index.items():
-            if query in tr:
-                for w in words:
-                    found.add((w['sureNo'], w['ayetNo']))
-        for ar, words in self.arabic_index.items():
-            if query in ar:
-                for w in words:
-                    found.add((w['sureNo'], w['ayetNo']))
-        for s, a in sorted(found):
-            v = self.verse_index.get((s, a))
-            if v:
-                it = QListWidgetItem(f"{s}/{a} - {v['turkce'][:50]}...")
-                it.setData(Qt.UserRole, (s, a))
-                self.results_list.addItem(it)
+        found = self._verses_of(self.turkish_index, self.turkish_suffixes.icerenler(query))
+        found |= self._verses_of(self.arabic_index, self.arabic_suffixes.icerenler(query))
+        self._add_results(found)
 
     # -------------------- Ayet Gösterim --------------------
     def show_verse_details(self, item):
@@ -447,7 +514,7 @@ class QuranAnalyzerApp(QMainWindow):
             return
 
         self._ensure_tooltip_store()
-        ayet_kelimeleri = [w for w in self.word_data if w['sureNo'] == sure and w['ayetNo'] == ayet]
+        ayet_kelimeleri = self.verse_words.get((sure, ayet), [])
         renkler = self.assign_colors_to_roots(ayet_kelimeleri)
 
         # Türkçe anlamı renklendir + link
@@ -458,8 +525,6 @@ class QuranAnalyzerApp(QMainWindow):
             if not tr:
                 continue
             url = f"kelime:{sure}/{ayet}/{k['kelimeNo']}"
-            tip = f"Arapça: {k.get('arapca','-')}\nKök: {kok or '-'}\nAnlam: {tr or '-'}"
-            self.kelime_tooltips[url] = tip
             repl = (f"<a href='{url}' style='text-decoration:none; color:{renkler.get(kok,'black')}; "
                     f"font-weight:bold'>{tr}</a>")
             highlighted_turkish = re.sub(fr"\b{re.escape(tr)}\b", repl, highlighted_turkish, flags=re.IGNORECASE)
@@ -473,12 +538,11 @@ class QuranAnalyzerApp(QMainWindow):
         # Kelime Analizi tablosu
         display_text += "<h3>Kelime Analizi:</h3>"
         display_text += "<table border='1'><tr><th>Kelime</th><th>Arapça</th><th>Anlam</th><th>Kök</th></tr>"
-        for k in sorted(ayet_kelimeleri, key=lambda x: x['kelimeNo']):
+        for k in ayet_kelimeleri:
             kok = (k.get('kok') or '').strip()
             tr = k.get('turkce', '')
             ar = k.get('arapca', '')
             url = f"kelime:{sure}/{ayet}/{k['kelimeNo']}"
-            self.kelime_tooltips[url] = f"Arapça: {ar or '-'}\nKök: {kok or '-'}\nAnlam: {tr or '-'}"
             anlam_html = f"<a href='{url}' style='text-decoration:none; color:{renkler.get(kok,'black')}'>{tr}</a>"
             display_text += (f"<tr><td>{k['kelimeNo']}</td>"
                              f"<td style='text-align: right;'>{ar}</td>"
@@ -512,7 +576,9 @@ class QuranAnalyzerApp(QMainWindow):
         verse = self.verse_index.get((s, a))
         if not verse:
             return
-        text = verse.get('arapca', '').strip()
+        # Aynı anahtar toplu üretimde de kullanılır: etiketsiz, tek parça Arapça metin
+        parcalar = ses_parcalari(verse.get('arapca', ''), 'ar')
+        text = parcalar[0] if parcalar else ""
         if not text:
             QMessageBox.warning(self, "Uyarı", "Arapça metin bulunamadı.")
             return
@@ -520,38 +586,32 @@ class QuranAnalyzerApp(QMainWindow):
 
     def _speak_arabic(self, text, sure, ayet):
         try:
-            # gTTS (internet gerekir)
-            tts = gTTS(text=text, lang='ar')
-            tmp_path = os.path.join(tempfile.gettempdir(), f"kuran_{sure}_{ayet}.mp3")
-            tts.save(tmp_path)
+            # Seçili motorla sentezle — daha önce sentezlenen metin önbellekten çalınır
+            motor = self.tts_motoru
+            tmp_path = self.ses_onbellegi.getir_veya_olustur(
+                text, 'ar', motor.ad, lambda hedef: motor.sentezle(text, 'ar', hedef),
+                ses=motor.ses, uzanti=motor.uzanti)
 
             # Çal
             self.player.setMedia(QMediaContent(QUrl.fromLocalFile(tmp_path)))
             self.player.play()
         except Exception as e:
-            QMessageBox.critical(self, "Ses Hatası", f"Ses oluşturulamadı.\nİnternet bağlantınızı kontrol edin.\n\n{e}")
+            ipucu = "" if self.tts_motoru.cevrimdisi else "\nİnternet bağlantınızı kontrol edin."
+            QMessageBox.critical(self, "Ses Hatası", f"Ses oluşturulamadı.{ipucu}\n\n{e}")
 
     # -------------------- Ayetler arası geçiş --------------------
     def show_previous_verse(self):
-        if hasattr(self, 'current_verse'):
-            s, a = self.current_verse
-            if a > 1:
-                self.show_verse_by_number(s, a - 1)
-            elif s > 1:
-                ps = s - 1
-                pa = max([v['ayet'] for v in self.verse_data if v['sure'] == ps])
-                self.show_verse_by_number(ps, pa)
+        self._show_verse_at_offset(-1)
 
     def show_next_verse(self):
+        self._show_verse_at_offset(1)
+
+    def _show_verse_at_offset(self, adim):
+        """Gezinme tablosunda seçili ayetten `adim` kadar ilerideki/gerideki ayete geçer"""
         if hasattr(self, 'current_verse'):
-            s, a = self.current_verse
-            na = a + 1
-            if any(v['sure'] == s and v['ayet'] == na for v in self.verse_data):
-                self.show_verse_by_number(s, na)
-            else:
-                ns = s + 1
-                if any(v['sure'] == ns for v in self.verse_data):
-                    self.show_verse_by_number(ns, 1)
+            i = self.verse_ordinal.get(self.current_verse)
+            if i is not None and 0 <= i + adim < len(self.verse_order):
+                self.show_verse_by_number(*self.verse_order[i + adim])
 
     def show_verse_by_number(self, sure, ayet):
         v = self.verse_index.get((sure, ayet))
@@ -563,7 +623,7 @@ class QuranAnalyzerApp(QMainWindow):
     # -------------------- İstatistik / Ağ / Bulut --------------------
     def show_stats(self, sure, ayet):
         stats_text = f"<h2>{sure}. sure, {ayet}. ayet İstatistikleri</h2>"
-        words = [w for w in self.word_data if w['sureNo'] == sure and w['ayetNo'] == ayet]
+        words = self.verse_words.get((sure, ayet), [])
         stats_text += f"<p>Toplam kelime sayısı: {len(words)}</p>"
 
         roots = [w.get('kok', '') for w in words if w.get('kok')]
@@ -574,82 +634,157 @@ class QuranAnalyzerApp(QMainWindow):
                 stats_text += f"<li>{k}: {s} kez</li>"
             stats_text += "</ul>"
 
-        similar = set()
-        for k in kok_say:
-            for w in self.root_index.get(k, []):
-                if not (w['sureNo'] == sure and w['ayetNo'] == ayet):
-                    similar.add((w['sureNo'], w['ayetNo']))
+        similar = self.similar_verses.benzerler(sure, ayet, k=10)
         if similar:
-            stats_text += "<h3>Benzer Ayetler (Aynı Kökler):</h3><ul>"
-            for s, a in sorted(similar)[:10]:
+            stats_text += "<h3>Benzer Ayetler (Ortak Kökler, TF-IDF):</h3><ul>"
+            for s, a, skor in similar:
                 v = self.verse_index.get((s, a))
                 if v:
-                    stats_text += f"<li>{s}/{a}: {v['turkce'][:50]}...</li>"
+                    ortak = ", ".join(self.similar_verses.ortak_kokler((sure, ayet), (s, a)))
+                    stats_text += (f"<li>{s}/{a} (%{skor * 100:.0f}): {v['turkce'][:50]}..."
+                                   f"<br><small>Ortak kökler: {ortak}</small></li>")
             stats_text += "</ul>"
 
         self.stats_display.setHtml(stats_text)
 
     def create_concept_network(self, sure, ayet):
-        self.network_canvas.figure.clear()
-        ax = self.network_canvas.figure.add_subplot(111)
-
+        words = self.verse_words.get((sure, ayet), [])
+        roots = list(dict.fromkeys((w.get('kok') or '').strip() for w in words if (w.get('kok') or '').strip()))
+        self._request_network(f"{sure}. sure, {ayet}. ayet Kavram Ağı", sure, ayet,
+                              lambda m: (roots, m.secim_kenarlari(roots)))
+
+    def show_root_network(self, kok):
+        """Kökün korpus genelinde en sık birlikte geçtiği köklerle ağını gösterir"""
+        self._request_network(f"{kok} kökü Kavram Ağı", "kok", kok, lambda m: m.kok_alt_agi(kok, 15))
+
+    def _refresh_network(self):
+        kok = self.root_network_input.text().strip()
+        if kok:
+            self.show_root_network(kok)
+        elif hasattr(self, 'current_verse'):
+            self.create_concept_network(*self.current_verse)
+
+    def _cooccurrence_matrix(self, pencere):
+        # İş havuzundan da çağrılır; her pencere için matris bir kez kurulur
+        with self._cooccurrence_lock:
+            if pencere not in self.cooccurrence:
+                self.cooccurrence[pencere] = KokBirliktelikMatrisi(self.word_data, pencere)
+            return self.cooccurrence[pencere]
+
+    @staticmethod
+    def _network_graph(dugumler, kenarlar):
         G = nx.Graph()
-        words = [w for w in self.word_data if w['sureNo'] == sure and w['ayetNo'] == ayet]
-        roots = [w.get('kok', '') for w in words if w.get('kok')]
-
-        for r in set(roots):
-            G.add_node(r)
-
-        for i, r1 in enumerate(roots):
-            for r2 in roots[i+1:]:
-                if r1 == r2:
-                    continue
-                if G.has_edge(r1, r2):
-                    G[r1][r2]['weight'] += 1
-                else:
-                    G.add_edge(r1, r2, weight=1)
-
-        if G.nodes():
-            pos = nx.spring_layout(G)
-            nx.draw_networkx_nodes(G, pos, node_size=700, ax=ax)
-            nx.draw_networkx_edges(G, pos, ax=ax)
-            nx.draw_networkx_labels(G, pos, ax=ax)
-            ax.set_title(f"{sure}. sure, {ayet}. ayet Kavram Ağı")
-            self.network_canvas.draw()
+        G.add_nodes_from(dugumler)
+        G.add_weighted_edges_from(kenarlar)
+        return G
+
+    def _network_key(self, sure, ayet, pencere, dugumler, kenarlar):
+        girdi = [sorted(dugumler), sorted([*sorted((u, v)), w] for u, v, w in kenarlar)]
+        return self.figure_cache.anahtar("ag", sure, ayet, [pencere, LAYOUT_SEED], girdi)
+
+    def _request_network(self, baslik, sure, ayet, alt_ag):
+        """alt_ag(matris) -> (düğümler, kenarlar); ağ önbellekte yoksa arka planda hesaplanır"""
+        pencere = self.network_window.currentData()
+        matris = self.cooccurrence.get(pencere)
+        if matris is not None:
+            dugumler, kenarlar = alt_ag(matris)
+            if not dugumler:
+                self.figure_jobs.iptal("ag")
+                self._show_pending(self.network_canvas, "")
+                return
+            pos = self.figure_cache.konumlar_getir(
+                self._network_key(sure, ayet, pencere, dugumler, kenarlar))
+            if pos is not None:
+                self.figure_jobs.iptal("ag")
+                self._figure_ready("ag", baslik, (self._network_graph(dugumler, kenarlar), pos))
+                return
+        # Matris kurulumu ve spring_layout arka planda; başka ayete geçilirse sonucu çizilmez
+        self._show_pending(self.network_canvas, "Hesaplanıyor...")
+        self.figure_jobs.gonder("ag", baslik, self._compute_network, sure, ayet, pencere, alt_ag)
+
+    def _compute_network(self, sure, ayet, pencere, alt_ag):
+        # İş havuzunda çalışır
+        dugumler, kenarlar = alt_ag(self._cooccurrence_matrix(pencere))
+        G = self._network_graph(dugumler, kenarlar)
+        if not dugumler:
+            return G, {}
+        anahtar = self._network_key(sure, ayet, pencere, dugumler, kenarlar)
+        pos = self.figure_cache.konumlar_getir(anahtar)
+        if pos is None:
+            pos = nx.spring_layout(G, seed=LAYOUT_SEED)
+            self.figure_cache.konumlar_kaydet(anahtar, pos)
+        return G, pos
 
     def create_wordcloud(self, sure, ayet):
-        self.wordcloud_canvas.figure.clear()
-        ax = self.wordcloud_canvas.figure.add_subplot(111)
         v = self.verse_index.get((sure, ayet))
         if v:
             text = re.sub(r'[%&]', '', v['turkce'])
-            wc = WordCloud(width=800, height=400, background_color='white').generate(text)
-            ax.imshow(wc, interpolation='bilinear'); ax.axis('off')
+            anahtar = self.figure_cache.anahtar("bulut", sure, ayet, WORDCLOUD_SIZE, text)
+            resim = self.figure_cache.resim_getir(anahtar)
+            if resim is not None:
+                self.figure_jobs.iptal("bulut")
+                self._figure_ready("bulut", (sure, ayet), resim)
+                return
+            self._show_pending(self.wordcloud_canvas, "Hesaplanıyor...")
+            self.figure_jobs.gonder("bulut", (sure, ayet), self._generate_wordcloud, anahtar, text)
+        else:
+            self.figure_jobs.iptal("bulut")
+            self._show_pending(self.wordcloud_canvas, "")
+
+    def _generate_wordcloud(self, anahtar, text):
+        # İş havuzunda çalışır; çizim için yalnızca görüntü dizisi döner
+        width, height = WORDCLOUD_SIZE
+        resim = WordCloud(width=width, height=height, background_color='white',
+                          random_state=LAYOUT_SEED).generate(text).to_array()
+        self.figure_cache.resim_kaydet(anahtar, resim)
+        return resim
+
+    def _show_pending(self, canvas, mesaj):
+        canvas.figure.clear()
+        ax = canvas.figure.add_subplot(111)
+        ax.text(0.5, 0.5, mesaj, ha='center', va='center', color='gray')
+        ax.axis('off')
+        canvas.draw_idle()
+
+    def _figure_ready(self, tur, baglam, sonuc):
+        """Arka planda hesaplanan en son grafiği arayüz iş parçacığında çizer"""
+        if tur == "ag":
+            G, pos = sonuc
+            self.network_canvas.figure.clear()
+            ax = self.network_canvas.figure.add_subplot(111)
+            if G.nodes():
+                nx.draw_networkx_nodes(G, pos, node_size=700, ax=ax)
+                nx.draw_networkx_edges(G, pos, ax=ax)
+                nx.draw_networkx_labels(G, pos, ax=ax)
+                ax.set_title(baglam)
+            self.network_canvas.draw_idle()
+        elif tur == "bulut":
+            sure, ayet = baglam
+            self.wordcloud_canvas.figure.clear()
+            ax = self.wordcloud_canvas.figure.add_subplot(111)
+            ax.imshow(sonuc, interpolation='bilinear'); ax.axis('off')
             ax.set_title(f"{sure}. sure, {ayet}. ayet Kelime Bulutu")
-            self.wordcloud_canvas.draw()
+            self.wordcloud_canvas.draw_idle()
 
     # -------------------- Favoriler --------------------
     def toggle_favorite(self):
         if hasattr(self, 'current_verse'):
             s, a = self.current_verse
-            vid = f"{s}/{a}"
-            if vid in self.favorites:
-                self.favorites.remove(vid)
+            if self.favorites.cikar(s, a):
                 self.favorite_button.setText("Favorilere Ekle")
             else:
-                self.favorites.append(vid)
+                self.favorites.ekle(s, a)
                 self.favorite_button.setText("Favorilerden Çıkar")
-            self.save_favorites()
 
     def update_favorite_button(self, sure, ayet):
-        vid = f"{sure}/{ayet}"
-        self.favorite_button.setText("Favorilerden Çıkar" if vid in self.favorites else "Favorilere Ekle")
+        self.favorite_button.setText("Favorilerden Çıkar" if (sure, ayet) in self.favorites else "Favorilere Ekle")
 
     def closeEvent(self, event):
-        self.save_favorites()
+        self.figure_jobs.kapat()
+        self.favorites.kapat()
         try:
-            if getattr(self, 'dict_conn', None):
-                self.dict_conn.close()
+            if getattr(self, 'sozluk', None):
+                self.sozluk.kapat()
         finally:
             event.accept()
 
@@ -1,13 +1,11 @@
 # components/analysis_tab.py
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QTextEdit, QLabel
-from utils.veri_isleyici import veri_yukle
-from collections import Counter
-import re
+from utils.analiz_ozeti import analiz_ozeti_yukle
 
 class AnalysisTab(QWidget):
     def __init__(self):
         super().__init__()
-        self.veriler = veri_yukle()
+        self.ozet = analiz_ozeti_yukle()  # veriler/analiz_ozeti.json, kaynak değişmişse yenilenir
         self.init_ui()
 
     def init_ui(self):
@@ -22,29 +20,14 @@ class AnalysisTab(QWidget):
         self.analyze()
 
     def analyze(self):
-        toplam_ayet = len(self.veriler)
-        sure_ayet_sayilari = {}
-        turkce_tum_kelime = []
-        arapca_tum_kelime = []
-
-        for ayet in self.veriler:
-            sure = ayet['sure']
-            sure_ayet_sayilari[sure] = sure_ayet_sayilari.get(sure, 0) + 1
-
-            turkce_kelimeler = re.findall(r'\b\w+\b', ayet['turkce'].lower())
-            arapca_kelimeler = re.findall(r'\b\w+\b', ayet['arapca'])
-
-            turkce_tum_kelime.extend(turkce_kelimeler)
-            arapca_tum_kelime.extend(arapca_kelimeler)
+        toplam_ayet = self.ozet['toplam_ayet']
+        sure_ayet_sayilari = {int(s): n for s, n in self.ozet['sure_ayet_sayilari'].items()}
 
         en_uzun_sure = max(sure_ayet_sayilari.items(), key=lambda x: x[1])
         en_kisa_sure = min(sure_ayet_sayilari.items(), key=lambda x: x[1])
 
-        turkce_sayac = Counter(turkce_tum_kelime)
-        arapca_sayac = Counter(arapca_tum_kelime)
-
-        en_sik_turkce = turkce_sayac.most_common(10)
-        en_sik_arapca = arapca_sayac.most_common(10)
+        en_sik_turkce = self.ozet['en_sik_turkce'][:10]
+        en_sik_arapca = self.ozet['en_sik_arapca'][:10]
 
         html = "<b>Toplam Ayet:</b> {}<br>".format(toplam_ayet)
         html += "<b>Toplam Sure:</b> {}<br><br>".format(len(sure_ayet_sayilari))
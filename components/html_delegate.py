@@ -0,0 +1,85 @@
+# components/html_delegate.py
+from PyQt5.QtWidgets import QStyledItemDelegate, QStyle
+from PyQt5.QtGui import QTextDocument, QColor, QPen
+from PyQt5.QtCore import Qt, QSize, QRectF
+
+
+class HtmlDelegate(QStyledItemDelegate):
+    """Model hücrelerindeki HTML'i kutu içinde çizen delegate.
+
+    Yalnızca görünen satırlar çizilir; satır yükseklikleri satır başına
+    önbelleğe alınır, model sıfırlanınca ya da genişlik değişince temizlenir.
+    """
+
+    def __init__(self, view, arka_plan="#f1f1f1", kenarlik="#ccc",
+                 hover_arka_plan=None, hover_kenarlik=None, bosluk=10, alt_bosluk=8):
+        super().__init__(view)
+        self.view = view
+        self.arka_plan = QColor(arka_plan)
+        self.kenarlik = QColor(kenarlik)
+        self.hover_arka_plan = QColor(hover_arka_plan or arka_plan)
+        self.hover_kenarlik = QColor(hover_kenarlik or kenarlik)
+        self.bosluk = bosluk
+        self.alt_bosluk = alt_bosluk
+        self._yukseklikler = {}  # satır -> yükseklik (_genislik için geçerli)
+        self._genislik = None
+
+    def onbellegi_temizle(self):
+        self._yukseklikler.clear()
+        self._genislik = None
+
+    def _hucre_genisligi(self, index):
+        # Tablo görünümlerinde sütun genişliği, listelerde viewport genişliği
+        if hasattr(self.view, "columnWidth"):
+            return self.view.columnWidth(index.column())
+        return self.view.viewport().width()
+
+    def _belge(self, html, font, genislik):
+        doc = QTextDocument()
+        doc.setDefaultFont(font)
+        doc.setDocumentMargin(0)
+        doc.setHtml(html or "")
+        doc.setTextWidth(max(1, genislik - 2 * self.bosluk))
+        return doc
+
+    def _kutu_ciz(self, painter, kutu, html, font, arka_plan, kenarlik):
+        """Verilen dikdörtgene kenarlıklı kutuyu ve içindeki HTML'i çizer"""
+        painter.save()
+        painter.setPen(QPen(kenarlik))
+        painter.setBrush(arka_plan)
+        painter.drawRect(kutu)
+
+        doc = self._belge(html, font, kutu.width() + 1)
+        painter.translate(kutu.left() + self.bosluk, kutu.top() + self.bosluk)
+        painter.setClipRect(QRectF(0, 0, doc.textWidth(), kutu.height() - self.bosluk))
+        doc.drawContents(painter)
+        painter.restore()
+
+    def _renkler(self, option, arka_plan=None):
+        vurgulu = bool(option.state & (QStyle.State_MouseOver | QStyle.State_Selected))
+        if vurgulu:
+            return self.hover_arka_plan, self.hover_kenarlik
+        return arka_plan or self.arka_plan, self.kenarlik
+
+    def _html_yuksekligi(self, html, font, genislik):
+        return int(self._belge(html, font, genislik).size().height()) + 2 * self.bosluk + self.alt_bosluk
+
+    def paint(self, painter, option, index):
+        kutu = option.rect.adjusted(0, 0, -1, -1 - self.alt_bosluk)
+        arka_plan, kenarlik = self._renkler(option)
+        self._kutu_ciz(painter, kutu, index.data(Qt.DisplayRole), option.font, arka_plan, kenarlik)
+
+    def _yukseklik_hesapla(self, option, index, genislik):
+        return self._html_yuksekligi(index.data(Qt.DisplayRole), option.font, genislik)
+
+    def sizeHint(self, option, index):
+        genislik = self._hucre_genisligi(index)
+        if genislik != self._genislik:
+            # Yeniden boyutlandırmada eski genişliğin yükseklikleri tutulmaz
+            self._yukseklikler.clear()
+            self._genislik = genislik
+        yukseklik = self._yukseklikler.get(index.row())
+        if yukseklik is None:
+            yukseklik = self._yukseklik_hesapla(option, index, genislik)
+            self._yukseklikler[index.row()] = yukseklik
+        return QSize(genislik, yukseklik)
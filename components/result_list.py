@@ -0,0 +1,54 @@
+# components/result_list.py
+from PyQt5.QtWidgets import QListView, QAbstractItemView
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex
+
+from components.html_delegate import HtmlDelegate
+
+AYET_ROLU = Qt.UserRole
+
+
+class AyetSonucModeli(QAbstractListModel):
+    """Arama sonuçlarını tutan liste modeli; HTML satır çizilirken üretilir"""
+
+    def __init__(self, html_olustur, parent=None):
+        super().__init__(parent)
+        self._html_olustur = html_olustur
+        self._sonuclar = []
+
+    def sonuclari_ayarla(self, sonuclar):
+        self.beginResetModel()
+        self._sonuclar = list(sonuclar)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._sonuclar)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._sonuclar):
+            return None
+        ayet = self._sonuclar[index.row()]
+        if role == Qt.DisplayRole:
+            return self._html_olustur(ayet)
+        if role == AYET_ROLU:
+            return ayet
+        return None
+
+
+def sonuc_listesi_olustur(model):
+    """Sanal kaydırmalı sonuç listesini (QListView + HtmlDelegate) oluşturur"""
+    view = QListView()
+    view.setModel(model)
+    view.setMouseTracking(True)
+    view.setSelectionMode(QAbstractItemView.SingleSelection)
+    view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+    view.setResizeMode(QListView.Adjust)
+    # Büyük sonuç kümelerinde satır yerleşimi parça parça yapılır
+    view.setLayoutMode(QListView.Batched)
+    view.setBatchSize(50)
+    view.setStyleSheet("QListView { background-color: #fff; border: none; }")
+
+    delegate = HtmlDelegate(view, arka_plan="#f1f1f1", kenarlik="#ccc",
+                            hover_arka_plan="#e8f4f8", hover_kenarlik="#4a90e2")
+    view.setItemDelegate(delegate)
+    model.modelReset.connect(delegate.onbellegi_temizle)
+    return view
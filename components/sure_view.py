@@ -0,0 +1,108 @@
+# components/sure_view.py
+from PyQt5.QtWidgets import QListView, QAbstractItemView
+from PyQt5.QtGui import QColor
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex
+
+from components.html_delegate import HtmlDelegate
+
+AYET_ROLU = Qt.UserRole
+SOL_HTML_ROLU = Qt.UserRole + 1
+SAG_HTML_ROLU = Qt.UserRole + 2
+
+SOL, SAG = 0, 1
+
+
+class SureKarsilastirmaModeli(QAbstractListModel):
+    """Her satırı bir ayet olan iki sütunlu meal karşılaştırma modeli.
+
+    Satırlar {'sure', 'ayet', 'arapca', 'sol', 'sag'} sözlükleridir; 'sag' None ise
+    satır tek kutu olarak gösterilir. HTML yalnızca satır çizilirken üretilir.
+    """
+
+    def __init__(self, html_olustur, parent=None):
+        super().__init__(parent)
+        self._html_olustur = html_olustur
+        self._satirlar = []
+
+    def satirlari_ayarla(self, satirlar):
+        self.beginResetModel()
+        self._satirlar = list(satirlar)
+        self.endResetModel()
+
+    def satir(self, row):
+        if 0 <= row < len(self._satirlar):
+            return self._satirlar[row]
+        return None
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._satirlar)
+
+    def data(self, index, role=Qt.DisplayRole):
+        satir = self.satir(index.row()) if index.isValid() else None
+        if satir is None:
+            return None
+        if role in (Qt.DisplayRole, SOL_HTML_ROLU):
+            return self._html_olustur(satir, SOL)
+        if role == SAG_HTML_ROLU:
+            return None if satir.get('sag') is None else self._html_olustur(satir, SAG)
+        if role == AYET_ROLU:
+            return satir
+        return None
+
+
+class KarsilastirmaDelegate(HtmlDelegate):
+    """Bir satırdaki iki meali yan yana iki kutu olarak çizer"""
+
+    def __init__(self, view, sol_arka_plan="#f0f8ff", sag_arka_plan="#fff0f5", aralik=6, **kwargs):
+        super().__init__(view, **kwargs)
+        self.sol_arka_plan = QColor(sol_arka_plan)
+        self.sag_arka_plan = QColor(sag_arka_plan)
+        self.aralik = aralik
+
+    def _sutun_genisligi(self, toplam, iki_sutun):
+        return (toplam - self.aralik) // 2 if iki_sutun else toplam
+
+    def paint(self, painter, option, index):
+        sag_html = index.data(SAG_HTML_ROLU)
+        rect = option.rect.adjusted(0, 0, -1, -1 - self.alt_bosluk)
+        genislik = self._sutun_genisligi(rect.width(), sag_html is not None)
+
+        sol_kutu = rect.adjusted(0, 0, genislik - rect.width(), 0)
+        arka_plan, kenarlik = self._renkler(option, self.sol_arka_plan)
+        self._kutu_ciz(painter, sol_kutu, index.data(SOL_HTML_ROLU), option.font, arka_plan, kenarlik)
+
+        if sag_html is not None:
+            sag_kutu = rect.adjusted(genislik + self.aralik, 0, 0, 0)
+            arka_plan, kenarlik = self._renkler(option, self.sag_arka_plan)
+            self._kutu_ciz(painter, sag_kutu, sag_html, option.font, arka_plan, kenarlik)
+
+    def _yukseklik_hesapla(self, option, index, genislik):
+        sag_html = index.data(SAG_HTML_ROLU)
+        sutun = self._sutun_genisligi(genislik, sag_html is not None)
+        yukseklik = self._html_yuksekligi(index.data(SOL_HTML_ROLU), option.font, sutun)
+        if sag_html is not None:
+            yukseklik = max(yukseklik, self._html_yuksekligi(sag_html, option.font, sutun))
+        return yukseklik
+
+    def taraf(self, x):
+        """Viewport x koordinatının hangi sütuna (SOL/SAG) düştüğünü döndürür"""
+        return SAG if x > self.view.viewport().width() // 2 else SOL
+
+
+def sure_gorunumu_olustur(model):
+    """Sadece görünen ayetleri yerleştiren karşılaştırma görünümünü oluşturur"""
+    view = QListView()
+    view.setModel(model)
+    view.setSelectionMode(QAbstractItemView.SingleSelection)
+    view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+    view.setResizeMode(QListView.Adjust)
+    view.setLayoutMode(QListView.Batched)
+    view.setBatchSize(20)
+    view.setContextMenuPolicy(Qt.ActionsContextMenu)
+    view.setStyleSheet("QListView { background-color: #fff; border: none; }")
+
+    delegate = KarsilastirmaDelegate(view, kenarlik="#ddd", hover_arka_plan="#e8f4f8",
+                                     hover_kenarlik="#4a90e2", alt_bosluk=5)
+    view.setItemDelegate(delegate)
+    model.modelReset.connect(delegate.onbellegi_temizle)
+    return view
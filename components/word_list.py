@@ -0,0 +1,89 @@
+# components/word_list.py
+from PyQt5.QtWidgets import QListView, QAbstractItemView
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex, QSortFilterProxyModel
+
+KELIME_ROLU = Qt.UserRole
+SIKLIK_ROLU = Qt.UserRole + 1
+
+
+class KelimeListesiModeli(QAbstractListModel):
+    """Önceden hesaplanmış (kelime, sıklık) dizilerini gösteren liste modeli"""
+
+    def __init__(self, kelimeler=(), sikliklar=None, parent=None):
+        super().__init__(parent)
+        self._kelimeler = []
+        self._sikliklar = None
+        self._satirlar = {}
+        self.kelimeleri_ayarla(kelimeler, sikliklar)
+
+    def kelimeleri_ayarla(self, kelimeler, sikliklar=None):
+        self.beginResetModel()
+        self._kelimeler = list(kelimeler)
+        self._sikliklar = list(sikliklar) if sikliklar is not None else None
+        self._satirlar = {k: i for i, k in enumerate(self._kelimeler)}
+        self.endResetModel()
+
+    def satir_no(self, kelime):
+        return self._satirlar.get(kelime)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._kelimeler)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == Qt.DisplayRole:
+            if self._sikliklar is None:
+                return self._kelimeler[row]
+            return f"{self._kelimeler[row]} ({self._sikliklar[row]})"
+        if role == KELIME_ROLU:
+            return self._kelimeler[row]
+        if role == SIKLIK_ROLU:
+            return self._sikliklar[row] if self._sikliklar is not None else None
+        return None
+
+
+class KelimeFiltreModeli(QSortFilterProxyModel):
+    """Kaynak modeli satır aralığına veya satır kümesine göre süzen proxy model"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._aralik = None
+        self._satirlar = None
+
+    def tumunu_goster(self):
+        self._aralik = None
+        self._satirlar = None
+        self.invalidateFilter()
+
+    def aralik_ayarla(self, bas, son):
+        """Sadece [bas, son) aralığındaki kaynak satırlarını gösterir"""
+        self._aralik = (bas, son)
+        self._satirlar = None
+        self.invalidateFilter()
+
+    def satirlari_ayarla(self, satirlar):
+        """Sadece verilen kaynak satır numaralarını gösterir"""
+        self._aralik = None
+        self._satirlar = set(satirlar)
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if self._aralik is not None:
+            return self._aralik[0] <= source_row < self._aralik[1]
+        if self._satirlar is not None:
+            return source_row in self._satirlar
+        return True
+
+
+def kelime_listesi_olustur(proxy):
+    """Kelime sekmesi için çoklu seçimli, sabit satır yükseklikli liste oluşturur"""
+    view = QListView()
+    view.setModel(proxy)
+    view.setUniformItemSizes(True)
+    view.setMaximumWidth(400)
+    view.setSelectionMode(QAbstractItemView.MultiSelection)
+    view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+    view.setContextMenuPolicy(Qt.CustomContextMenu)
+    return view
@@ -2,22 +2,27 @@
 
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QLineEdit, QPushButton,
-    QLabel, QTextEdit, QScrollArea, QMessageBox, QCheckBox, QHBoxLayout, QComboBox, QTabWidget, QTableWidget, QTableWidgetItem, QDialog, QListWidget, QListWidgetItem, QGroupBox, QSpinBox, QMenu, QAbstractItemView
+    QLabel, QTextEdit, QMessageBox, QCheckBox, QHBoxLayout, QComboBox, QTabWidget, QTableWidget, QTableWidgetItem, QDialog, QListWidget, QListWidgetItem, QGroupBox, QSpinBox, QMenu, QCompleter, QAbstractSlider, QAction
 )
-from PyQt5.QtGui import QTextCursor, QTextCharFormat, QColor
-from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QTextCursor, QTextCharFormat, QColor, QCursor
+from PyQt5.QtCore import Qt, QStringListModel
 import sys
 import re
-import json
-import os
 import difflib
-from gtts import gTTS
-import playsound
 from qalsadi.lemmatizer import Lemmatizer
 import matplotlib
 matplotlib.use('Qt5Agg')
 import matplotlib.pyplot as plt
 from utils.veri_isleyici import veri_yukle, turkce_transkript_yukle, kuran_kelimeleri_hazirla, normalize_text, normalize_arabic
+from utils.onek_indeksi import OnekIndeksi
+from utils.html_onbellegi import HtmlOnbellegi, HTML_ONBELLEK_KAPASITESI
+from utils.favori_deposu import FavoriDeposu
+from utils.istatistik_motoru import IstatistikMotoru
+from utils.ses_motoru import SesMotoru
+from utils.tts_motorlari import MOTORLAR, kullanilabilir_motorlar
+from components.result_list import AyetSonucModeli, AYET_ROLU, sonuc_listesi_olustur
+from components.word_list import KelimeListesiModeli, KelimeFiltreModeli, KELIME_ROLU, kelime_listesi_olustur
+from components.sure_view import SureKarsilastirmaModeli, sure_gorunumu_olustur, SOL, SAG
 from yardimci_araclar import vurgu_ekle, vurgu_ekle as vurgu_ekle
 try:
     import zemberek
@@ -243,13 +248,21 @@ class QuranAnalyzer(QWidget):
         super().__init__()
         self.setWindowTitle("Kur’an Veri Analiz Programı")
         self.resize(1200, 800)
-        self.sayfa = 0
-        self.satirSayisi = 20
+        self.son_arama = ""
+        self.son_arama_coklu = False
+        self.son_arama_duyarli = False
         self.secili_meal = "Diyanet İşleri Meali (Yeni)"
         self.veriler = veri_yukle(self.secili_meal)
+        self.meal_verileri = {self.secili_meal: self.veriler}  # Karşılaştırma için yüklenen mealler
+        self.istatistik_motoru = IstatistikMotoru()  # Meal başına önbellekli istatistikler
+        self.html_onbellegi = HtmlOnbellegi(HTML_ONBELLEK_KAPASITESI)  # Arama, tek ayet ve sure görünümlerinin ortak HTML önbelleği
+        self.ses_motoru = SesMotoru(self)  # Sentez ve oynatma arka planda
         self.turkce_transkript_verisi = turkce_transkript_yukle()  # Kelime bazlı Türkçe transkript verisi
         self.kuran_kelimeleri = kuran_kelimeleri_hazirla()  # Kuranda geçen tüm kelimeler
         self.kelime_sikliklari = self.kelime_sikliklarini_hesapla()  # Kelime sıklıkları
+        # Harf filtreleri ve otomatik tamamlama için önek indeksleri
+        self.turkce_onek_indeksi = OnekIndeksi(self.kuran_kelimeleri.get("turkce", []), anahtar=normalize_text)
+        self.arapca_onek_indeksi = OnekIndeksi(self.kuran_kelimeleri.get("arapca", []), anahtar=normalize_arabic)
         # self.kelime_kokleri = self.kelime_koklerini_hazirla()  # Kelime kökleri sözlüğü - çok yavaş, arama sırasında hesaplanacak
         self.sureler = sorted(set(item['sure'] for item in self.veriler))
         self.sure_isimleri = [
@@ -267,11 +280,7 @@ class QuranAnalyzer(QWidget):
             "Zilzal", "Adiyat", "Karia", "Tekasur", "Asr", "Humeze", "Fil", "Kureyş", "Ma'un",
             "Kevser", "Kafirun", "Nasr", "Tebbet", "İhlas", "Felak", "Nas"
         ]
-        if os.path.exists('favorites.json'):
-            with open('favorites.json', 'r', encoding='utf-8') as f:
-                self.favorites = json.load(f)
-        else:
-            self.favorites = []
+        self.favorites = FavoriDeposu()  # (sure, ayet) anahtarları, eski favorites.json bir kez aktarılır
         self.init_ui()
 
     def kelime_sikliklarini_hesapla(self):
@@ -328,6 +337,13 @@ class QuranAnalyzer(QWidget):
         self.arama_kutusu = QLineEdit()
         self.arama_kutusu.setPlaceholderText("Kelime girin...")
         self.arama_kutusu.returnPressed.connect(self.guncelle_sayfa)
+        # Öneriler, completer kendi textEdited bağlantısını kurmadan önce güncellenmeli
+        self.arama_kutusu.textEdited.connect(self.arama_onerilerini_guncelle)
+        self.arama_onerileri = QStringListModel()
+        self.arama_tamamlayici = QCompleter(self.arama_onerileri, self)
+        self.arama_tamamlayici.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        self.arama_tamamlayici.setMaxVisibleItems(15)
+        self.arama_kutusu.setCompleter(self.arama_tamamlayici)
         arama_kontrol_layout.addWidget(self.arama_kutusu)
 
         self.ara_buton = QPushButton("Ara")
@@ -348,6 +364,28 @@ class QuranAnalyzer(QWidget):
         self.sesli_oku_btn.setEnabled(False)
         arama_kontrol_layout.addWidget(self.sesli_oku_btn)
 
+        self.ses_durdur_btn = QPushButton("⏹ Durdur")
+        self.ses_durdur_btn.clicked.connect(self.ses_motoru.durdur)
+        self.ses_durdur_btn.setEnabled(False)
+        arama_kontrol_layout.addWidget(self.ses_durdur_btn)
+
+        # Sentez motoru seçimi (çevrimdışı motorlar ağ olmadan çalışır)
+        self.tts_motor_secici = QComboBox()
+        for ad in kullanilabilir_motorlar():
+            self.tts_motor_secici.addItem(MOTORLAR[ad].etiket, ad)
+        secili_index = self.tts_motor_secici.findData(self.ses_motoru.tts.ad)
+        if secili_index >= 0:
+            self.tts_motor_secici.setCurrentIndex(secili_index)
+        self.tts_motor_secici.currentIndexChanged.connect(
+            lambda i: self.ses_motoru.motor_degistir(self.tts_motor_secici.itemData(i)))
+        arama_kontrol_layout.addWidget(self.tts_motor_secici)
+
+        self.ses_durum_label = QLabel("")
+        arama_kontrol_layout.addWidget(self.ses_durum_label)
+        self.ses_motoru.simdi_caliyor.connect(self.ses_caliyor)
+        self.ses_motoru.bitti.connect(self.ses_bitti)
+        self.ses_motoru.hata.connect(lambda mesaj: QMessageBox.warning(self, "TTS Hata", mesaj))
+
         ust_layout.addLayout(arama_kontrol_layout)
 
         # Filtre checkbox'ları
@@ -463,12 +501,10 @@ class QuranAnalyzer(QWidget):
         sol_layout = QVBoxLayout()
         sol_layout.addWidget(QLabel("Arama Sonuçları:"))
 
-        self.sonuc_alani = QScrollArea()
-        self.sonuc_alani.setWidgetResizable(True)
-        self.scroll_widget = QWidget()
-        self.scroll_layout = QVBoxLayout()
-        self.scroll_widget.setLayout(self.scroll_layout)
-        self.sonuc_alani.setWidget(self.scroll_widget)
+        self.sonuc_modeli = AyetSonucModeli(self.sonuc_html_olustur)
+        self.sonuc_alani = sonuc_listesi_olustur(self.sonuc_modeli)
+        # Ayet seçimi için tıklanabilir yap
+        self.sonuc_alani.clicked.connect(lambda index: self.ayet_sec(index.data(AYET_ROLU)))
         sol_layout.addWidget(self.sonuc_alani)
 
         sol_panel.setLayout(sol_layout)
@@ -573,18 +609,33 @@ class QuranAnalyzer(QWidget):
         self.sure_secici.currentIndexChanged.connect(self.goster_sure)
         karsilastirma_layout.addWidget(self.sure_secici)
 
-        self.sure_alani = QScrollArea()
-        self.sure_alani.setWidgetResizable(True)
-        self.sure_widget = QWidget()
-        self.sol_layout = QVBoxLayout()
-        self.sag_layout = QVBoxLayout()
-        sure_ana_layout = QHBoxLayout()
-        sure_ana_layout.addLayout(self.sol_layout)
-        sure_ana_layout.addLayout(self.sag_layout)
-        self.sure_widget.setLayout(sure_ana_layout)
-        self.sure_alani.setWidget(self.sure_widget)
+        self.sure_modeli = SureKarsilastirmaModeli(self.sure_html_olustur)
+        self.sure_alani = sure_gorunumu_olustur(self.sure_modeli)
+        self.sure_alani.pressed.connect(self.sure_tarafi_sec)
+        self.sure_alani.doubleClicked.connect(lambda index: self.sure_sesli_oku())
+        self.sure_secili_taraf = SOL
         karsilastirma_layout.addWidget(self.sure_alani)
 
+        # Tüm ayetler için tek bir sesli okuma eylemi (buton, sağ tık, çift tık)
+        self.sure_sesli_oku_action = QAction("🔊 Sesli Oku", self)
+        self.sure_sesli_oku_action.setShortcut("Ctrl+R")
+        self.sure_sesli_oku_action.triggered.connect(self.sure_sesli_oku)
+        self.sure_alani.addAction(self.sure_sesli_oku_action)
+        sure_ses_layout = QHBoxLayout()
+        sure_tts_btn = QPushButton("🔊 Seçili Ayeti Sesli Oku")
+        sure_tts_btn.clicked.connect(self.sure_sesli_oku_action.trigger)
+        sure_ses_layout.addWidget(sure_tts_btn)
+
+        # Sürekli okuma: sonraki ayetler çalarken arka planda hazırlanır
+        sure_surekli_btn = QPushButton("▶ Sureyi Sürekli Oku")
+        sure_surekli_btn.clicked.connect(self.sure_surekli_oku)
+        sure_ses_layout.addWidget(sure_surekli_btn)
+
+        sure_durdur_btn = QPushButton("⏹ Durdur")
+        sure_durdur_btn.clicked.connect(self.ses_motoru.durdur)
+        sure_ses_layout.addWidget(sure_durdur_btn)
+        karsilastirma_layout.addLayout(sure_ses_layout)
+
         self.karsilastirma_tab.setLayout(karsilastirma_layout)
         self.tabs.addTab(self.karsilastirma_tab, "Karşılaştırmalı Meal")
 
@@ -680,12 +731,12 @@ class QuranAnalyzer(QWidget):
         sol_layout.addLayout(harf_layout)
 
         # Türkçe kelime listesi
-        self.turkce_liste = QListWidget()
-        self.turkce_liste.setMaximumWidth(400)
-        self.turkce_liste.setSelectionMode(QAbstractItemView.MultiSelection)
-        self.turkce_liste.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.turkce_kelime_modeli = KelimeListesiModeli()
+        self.turkce_filtre = KelimeFiltreModeli()
+        self.turkce_filtre.setSourceModel(self.turkce_kelime_modeli)
+        self.turkce_liste = kelime_listesi_olustur(self.turkce_filtre)
         self.turkce_liste.customContextMenuRequested.connect(self.turkce_liste_sag_tik)
-        self.turkce_liste.itemDoubleClicked.connect(self.turkce_kelime_detay)
+        self.turkce_liste.doubleClicked.connect(self.turkce_kelime_detay)
         sol_layout.addWidget(self.turkce_liste)
 
         sol_panel.setLayout(sol_layout)
@@ -740,12 +791,12 @@ class QuranAnalyzer(QWidget):
         sag_layout.addLayout(arapca_harf_layout)
 
         # Arapça kelime listesi
-        self.arapca_liste = QListWidget()
-        self.arapca_liste.setMaximumWidth(400)
-        self.arapca_liste.setSelectionMode(QAbstractItemView.MultiSelection)
-        self.arapca_liste.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.arapca_kelime_modeli = KelimeListesiModeli()
+        self.arapca_filtre = KelimeFiltreModeli()
+        self.arapca_filtre.setSourceModel(self.arapca_kelime_modeli)
+        self.arapca_liste = kelime_listesi_olustur(self.arapca_filtre)
         self.arapca_liste.customContextMenuRequested.connect(self.arapca_liste_sag_tik)
-        self.arapca_liste.itemDoubleClicked.connect(self.arapca_kelime_detay)
+        self.arapca_liste.doubleClicked.connect(self.arapca_kelime_detay)
         sag_layout.addWidget(self.arapca_liste)
 
         sag_panel.setLayout(sag_layout)
@@ -763,79 +814,51 @@ class QuranAnalyzer(QWidget):
         self.kelime_listelerini_doldur()  # Kelime listelerini doldur
 
     def speak_text(self, text):
-        try:
-            import tempfile
-            import time
-
-            # Benzersiz geçici dosya oluştur
-            with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as temp_file:
-                temp_path = temp_file.name
-
-            # TTS oluştur ve kaydet
-            tts = gTTS(text=text, lang='tr')
-            tts.save(temp_path)
-
-            # pygame ile ses dosyasını oynat (daha güvenilir)
-            try:
-                import pygame
-
-                # pygame mixer'ını başlat (eğer başlatılmamışsa)
-                if not pygame.mixer.get_init():
-                    pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
-
-                # Önceki müziği durdur ve temizle
-                if pygame.mixer.music.get_busy():
-                    pygame.mixer.music.stop()
-                pygame.mixer.music.unload()
-
-                pygame.mixer.music.load(temp_path)
-                pygame.mixer.music.set_volume(0.8)  # Ses seviyesini %80'e ayarla
-                pygame.mixer.music.play()
-
-                # Oynatma bitene kadar bekle (maksimum 30 saniye)
-                timeout = 0
-                while pygame.mixer.music.get_busy() and timeout < 300:  # 30 saniye timeout
-                    time.sleep(0.1)
-                    timeout += 1
-
-                pygame.mixer.music.stop()
-                pygame.mixer.music.unload()  # Belleği temizle
-
-            except Exception as pygame_error:
-                # pygame başarısız olursa playsound'u dene
-                try:
-                    playsound.playsound(temp_path, block=True)
-                except Exception as playsound_error:
-                    # Her iki yöntem de başarısız olursa kullanıcıya bilgi ver
-                    error_msg = f"Ses oynatma başarısız oldu:\n\n"
-                    error_msg += f"pygame hatası: {str(pygame_error)}\n\n"
-                    error_msg += f"playsound hatası: {str(playsound_error)}\n\n"
-                    error_msg += "Öneriler:\n"
-                    error_msg += "1. Ses sürücülerinizi kontrol edin\n"
-                    error_msg += "2. Başka uygulamalarda ses çalışıyor mu?\n"
-                    error_msg += "3. Sistem ses ayarlarını kontrol edin\n"
-                    error_msg += "4. Gerekirse bilgisayarı yeniden başlatın"
-
-                    QMessageBox.warning(self, "TTS Hata", error_msg)
-                    return
-
-            # Geçici dosyayı temizle
-            try:
-                os.remove(temp_path)
-            except:
-                pass  # Dosya silinemezse devam et
-
-        except Exception as e:
-            QMessageBox.warning(self, "TTS Hata", f"Sesli okuma hatası: {str(e)}")
+        """Metni arayüzü bekletmeden ses motoruna gönderir"""
+        self.ses_motoru.seslendir(text, dil='tr')
+        self.ses_durum_label.setText("🔊 Hazırlanıyor...")
+        self.ses_durdur_btn.setEnabled(True)
+
+    def ses_caliyor(self, text, kimlik=None):
+        """Ses motoru çalmaya başladığında durum etiketini günceller"""
+        kisa = text if len(text) <= 40 else text[:40] + "..."
+        self.ses_durum_label.setText(f"🔊 {kisa}")
+        self.ses_durdur_btn.setEnabled(True)
+
+        # Sürekli okumada çalan ayeti karşılaştırma görünümünde işaretle
+        if isinstance(kimlik, tuple) and kimlik[0] == "sure":
+            _, sure_no, row = kimlik
+            satir = self.sure_modeli.satir(row)
+            if satir and satir['sure'] == sure_no:
+                index = self.sure_modeli.index(row)
+                self.sure_alani.setCurrentIndex(index)
+                self.sure_alani.scrollTo(index)
+
+    def ses_bitti(self):
+        self.ses_durum_label.setText("")
+        self.ses_durdur_btn.setEnabled(False)
+
+    def closeEvent(self, event):
+        self.ses_motoru.kapat()
+        self.favorites.kapat()
+        event.accept()
+
+    def arama_onerilerini_guncelle(self, text):
+        """Arama kutusu için önek indeksinden öneri listesini doldurur"""
+        onek = text.strip()
+        if len(onek) < 2:
+            self.arama_onerileri.setStringList([])
+            return
+        limit = 30
+        oneriler = self.turkce_onek_indeksi.onek_ara(onek, limit)
+        oneriler += self.arapca_onek_indeksi.onek_ara(onek, limit - len(oneriler))
+        self.arama_onerileri.setStringList(oneriler)
 
     def guncelle_sayfa(self):
         kelime = self.arama_kutusu.text().strip()
-        for i in reversed(range(self.scroll_layout.count())):
-            widget = self.scroll_layout.itemAt(i).widget()
-            if widget:
-                widget.setParent(None)
-
         if not kelime:
+            self.sonuc_modeli.sonuclari_ayarla([])
+            self.sonuc_sayisi_label.setText("")
             return
 
         flags = 0 if self.case_sensitive.isChecked() else re.IGNORECASE
@@ -961,73 +984,63 @@ class QuranAnalyzer(QWidget):
 
         toplam_sonuc = len(sonuclar)
         self.sonuc_sayisi_label.setText(f"Toplam sonuç: {toplam_sonuc}")
-        toplam_sayfa = max(1, (len(sonuclar) + self.satirSayisi - 1) // self.satirSayisi)
-        self.sayfa = min(self.sayfa, toplam_sayfa - 1)
-        basla = self.sayfa * self.satirSayisi
-        bitis = basla + self.satirSayisi
-
-        for v in sonuclar[basla:bitis]:
-            sure_adi = self.sure_isimleri[v['sure']-1]
-            if is_arabic_root(kelime):
-                # Kök arama: kök eşleşen kelimeleri vurgula
-                root_words = get_root_words_from_ayet(v.get("arapca", ""), kelime)
-                meal = vurgu_ekle(v.get("meal", ""), root_words, renk="orange")
-                arapca = vurgu_ekle(v.get("arapca", ""), root_words, renk="yellow")
-            else:
-                # Normal arama
-                if self.multi_word.isChecked():
-                    kelimeler = kelime.split()
-                else:
-                    kelimeler = [kelime]
-                meal = vurgu_ekle(v.get("meal", ""), kelimeler, renk="orange")
-                arapca = vurgu_ekle(v.get("arapca", ""), kelimeler, renk="yellow")
-
-            html = f"""
-            <div style='font-size:12px; color:gray; margin-bottom:5px;'>{v['sure']}-{sure_adi}, Ayet {v['ayet']}</div>
-            <div style='font-size:18px; font-weight:bold;'>{meal}</div>
-            <div style='font-size:16px;'>{arapca}</div>
-            """
 
-            widget = QWidget()
-            layout_h = QHBoxLayout()
-            kutu = QLabel()
-            kutu.setWordWrap(True)
-            kutu.setTextInteractionFlags(Qt.TextSelectableByMouse)
-            kutu.setStyleSheet("""
-                QLabel {
-                    background-color: #f1f1f1;
-                    border: 1px solid #ccc;
-                    padding: 10px;
-                    margin-bottom: 8px;
-                    font-size: 14px;
-                }
-                QLabel:hover {
-                    background-color: #e8f4f8;
-                    border: 1px solid #4a90e2;
-                }
-            """)
-            kutu.setTextFormat(Qt.RichText)
-            kutu.setText(html)
-            # Ayet seçimi için tıklanabilir yap
-            kutu.mousePressEvent = lambda ev, ayet=v: self.ayet_sec(ayet)
-            layout_h.addWidget(kutu)
-            widget.setLayout(layout_h)
-            self.scroll_layout.addWidget(widget)
+        # Satırlar görünür oldukça delegate tarafından çizilir
+        self.son_arama = kelime
+        self.son_arama_coklu = self.multi_word.isChecked()
+        self.son_arama_duyarli = self.case_sensitive.isChecked()
+        # Liste her satırın yüksekliğini (parça parça) ölçer; önbellek tüm sonuçları
+        # ve sure görünümlerini tutabilmeli, yoksa ölçüm kendi kayıtlarını atar
+        self.html_onbellegi.kapasite_ayarla(toplam_sonuc + HTML_ONBELLEK_KAPASITESI)
+        self.sonuc_modeli.sonuclari_ayarla(sonuclar)
+        self.sonuc_alani.scrollToTop()
+
+    def sonuc_html_olustur(self, v):
+        """Bir arama sonucunun HTML'ini son aramanın vurgularıyla üretir"""
+        kelime = self.son_arama
+        if is_arabic_root(kelime):
+            terimler = ("kök", kelime)
+        else:
+            terimler = tuple(kelime.split()) if self.son_arama_coklu else (kelime,)
+        anahtar = ("arama", v['sure'], v['ayet'], self.secili_meal, terimler, self.son_arama_duyarli)
+        return self.html_onbellegi.getir(anahtar, lambda: self._sonuc_html_uret(v, kelime))
+
+    def _sonuc_html_uret(self, v, kelime):
+        sure_adi = self.sure_isimleri[v['sure']-1]
+        if is_arabic_root(kelime):
+            # Kök arama: kök eşleşen kelimeleri vurgula
+            root_words = get_root_words_from_ayet(v.get("arapca", ""), kelime)
+            meal = vurgu_ekle(v.get("meal", ""), root_words, renk="orange")
+            arapca = vurgu_ekle(v.get("arapca", ""), root_words, renk="yellow")
+        else:
+            # Normal arama
+            if self.son_arama_coklu:
+                kelimeler = kelime.split()
+            else:
+                kelimeler = [kelime]
+            duyarli = self.son_arama_duyarli
+            meal = vurgu_ekle(v.get("meal", ""), kelimeler, renk="orange", buyuk_kucuk_duyarli=duyarli)
+            arapca = vurgu_ekle(v.get("arapca", ""), kelimeler, renk="yellow", buyuk_kucuk_duyarli=duyarli)
+
+        return f"""
+        <div style='font-size:12px; color:gray; margin-bottom:5px;'>{v['sure']}-{sure_adi}, Ayet {v['ayet']}</div>
+        <div style='font-size:18px; font-weight:bold;'>{meal}</div>
+        <div style='font-size:16px;'>{arapca}</div>
+        """
 
     def meal_degistir(self):
         self.secili_meal = self.meal_secici.currentText()
         self.veriler = veri_yukle(self.secili_meal)
-        self.sayfa = 0
         self.guncelle_sayfa()
+        self.guncelle_istatistikler()
 
     def sayfa_geri(self):
-        if self.sayfa > 0:
-            self.sayfa -= 1
-            self.guncelle_sayfa()
+        """Sonuç listesini bir ekran yukarı kaydırır"""
+        self.sonuc_alani.verticalScrollBar().triggerAction(QAbstractSlider.SliderPageStepSub)
 
     def sayfa_ileri(self):
-        self.sayfa += 1
-        self.guncelle_sayfa()
+        """Sonuç listesini bir ekran aşağı kaydırır"""
+        self.sonuc_alani.verticalScrollBar().triggerAction(QAbstractSlider.SliderPageStepAdd)
 
     def ayet_sec(self, ayet):
         """Arama sonuçlarından bir ayet seçildiğinde çağrılır"""
@@ -1084,61 +1097,22 @@ class QuranAnalyzer(QWidget):
         self.turkce_transkript.setHtml(html)
 
     def favoriye_ekle(self, ayet):
-        if ayet not in self.favorites:
-            self.favorites.append(ayet)
-            with open('favorites.json', 'w', encoding='utf-8') as f:
-                json.dump(self.favorites, f, ensure_ascii=False, indent=4)
+        if self.favorites.ekle(ayet['sure'], ayet['ayet']):
             QMessageBox.information(self, "Favori", "Ayet favorilere eklendi!")
         else:
             QMessageBox.information(self, "Favori", "Bu ayet zaten favorilerde.")
 
     def guncelle_istatistikler(self):
-        if not self.veriler:
+        ist = self.istatistik_motoru.hesapla(self.secili_meal, self.veriler)
+        if not ist:
             return
 
-        sureler = {}
-        toplam_ayet = len(self.veriler)
-        toplam_kelime_turkce = 0
-        toplam_kelime_arapca = 0
-        unique_words_turkce = set()
-        unique_words_arapca = set()
-        word_frequencies = {}
-        letter_counts = {}
-        word_lengths = {}
+        sureler = ist['sureler']
+        toplam_ayet = ist['toplam_ayet']
+        toplam_kelime_turkce = ist['toplam_kelime_turkce']
+        toplam_kelime_arapca = ist['toplam_kelime_arapca']
         mekki_sureler = [1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114]
 
-        for item in self.veriler:
-            sure = item['sure']
-            if sure not in sureler:
-                sureler[sure] = 0
-            sureler[sure] += 1
-
-            # Türkçe kelime analizi
-            meal = item.get('meal', '')
-            turkce_words = meal.split()
-            toplam_kelime_turkce += len(turkce_words)
-            for word in turkce_words:
-                word_lower = word.lower().strip('.,!?;:')
-                if word_lower:
-                    unique_words_turkce.add(word_lower)
-                    word_frequencies[word_lower] = word_frequencies.get(word_lower, 0) + 1
-
-            # Arapça kelime analizi
-            arapca_html = item.get('arapca', '')
-            arapca_words = re.findall(r'<span[^>]*>([^<]+)</span>', arapca_html)
-            toplam_kelime_arapca += len(arapca_words)
-            for word in arapca_words:
-                word_normalized = normalize_arabic(word)
-                if word_normalized:
-                    unique_words_arapca.add(word_normalized)
-                    # Harf analizi
-                    for char in word_normalized:
-                        if char.isalpha():
-                            letter_counts[char] = letter_counts.get(char, 0) + 1
-                    # Kelime uzunluğu analizi
-                    length = len(word_normalized)
-                    word_lengths[length] = word_lengths.get(length, 0) + 1
-
         sure_sayisi = len(sureler)
         en_uzun_sure = max(sureler.values())
         en_kisa_sure = min(sureler.values())
@@ -1150,14 +1124,12 @@ class QuranAnalyzer(QWidget):
         mekki_sayisi = len([s for s in sureler.keys() if s in mekki_sureler])
         medeni_sayisi = sure_sayisi - mekki_sayisi
 
-        # En sık kullanılan kelimeler (Türkçe)
-        top_words = sorted(word_frequencies.items(), key=lambda x: x[1], reverse=True)[:10]
-
-        # En sık kullanılan harfler
-        top_letters = sorted(letter_counts.items(), key=lambda x: x[1], reverse=True)[:5]
+        # En sık kullanılan kelimeler (Türkçe) ve harfler
+        top_words = ist['en_sik_kelimeler']
+        top_letters = ist['en_sik_harfler']
 
         # Kelime uzunluğu dağılımı
-        avg_word_length = sum(k * v for k, v in word_lengths.items()) / sum(word_lengths.values()) if word_lengths else 0
+        avg_word_length = ist['ortalama_kelime_uzunlugu']
 
         # İstatistikleri tabloya ekle
         self.istatistik_tabla.setRowCount(20)
@@ -1212,12 +1184,12 @@ class QuranAnalyzer(QWidget):
 
         # Benzersiz kelime sayısı
         self.istatistik_tabla.setItem(row, 0, QTableWidgetItem("Benzersiz Kelime (Türkçe)"))
-        self.istatistik_tabla.setItem(row, 1, QTableWidgetItem(str(len(unique_words_turkce))))
+        self.istatistik_tabla.setItem(row, 1, QTableWidgetItem(str(ist['benzersiz_turkce'])))
         self.istatistik_tabla.setItem(row, 2, QTableWidgetItem("Meal metnindeki benzersiz kelime sayısı"))
         row += 1
 
         self.istatistik_tabla.setItem(row, 0, QTableWidgetItem("Benzersiz Kelime (Arapça)"))
-        self.istatistik_tabla.setItem(row, 1, QTableWidgetItem(str(len(unique_words_arapca))))
+        self.istatistik_tabla.setItem(row, 1, QTableWidgetItem(str(ist['benzersiz_arapca'])))
         self.istatistik_tabla.setItem(row, 2, QTableWidgetItem("Arapça metindeki benzersiz kelime sayısı"))
         row += 1
 
@@ -1295,40 +1267,16 @@ class QuranAnalyzer(QWidget):
             ayet_item = next((item for item in self.veriler if item['sure'] == sure and item['ayet'] == ayet), None)
             if ayet_item:
                 # Tek ayet göster
-                for i in reversed(range(self.sol_layout.count())):
-                    widget = self.sol_layout.itemAt(i).widget()
-                    if widget:
-                        widget.setParent(None)
-
-                arapca = ayet_item.get('arapca', '')
-                meal = ayet_item.get('meal', '')
-
-                html = f"""
-                <div style='font-size:16px; font-weight:bold; margin-bottom:10px;'>
-                    <span style='color:blue;'>Süre {sure}, Ayet {ayet}:</span><br>
-                    <span style='font-size:18px;'>{arapca}</span><br>
-                    <span style='color:green;'>{meal}</span>
-                </div>
-                """
-
-                kutu = QLabel()
-                kutu.setWordWrap(True)
-                kutu.setTextInteractionFlags(Qt.TextSelectableByMouse)
-                kutu.setStyleSheet("""
-                    QLabel {
-                        background-color: #f9f9f9;
-                        border: 1px solid #ddd;
-                        padding: 15px;
-                        margin-bottom: 10px;
-                        font-size: 14px;
-                    }
-                """)
-                kutu.setTextFormat(Qt.RichText)
-                kutu.setText(html)
-                self.sol_layout.addWidget(kutu)
-                tts_btn = QPushButton("🔊 Sesli Oku")
-                tts_btn.clicked.connect(lambda checked, text=meal: self.speak_text(text))
-                self.sol_layout.addWidget(tts_btn)
+                self.sure_modeli.satirlari_ayarla([{
+                    'sure': sure,
+                    'ayet': ayet,
+                    'arapca': ayet_item.get('arapca', ''),
+                    'sol': ayet_item.get('meal', ''),
+                    'sag': None,
+                    'sol_meal': self.secili_meal,
+                    'sag_meal': None,
+                }])
+                self.sure_alani.setCurrentIndex(self.sure_modeli.index(0))
             else:
                 QMessageBox.warning(self, "Bulunamadı", f"Süre {sure}, Ayet {ayet} bulunamadı")
         except ValueError:
@@ -1448,189 +1396,175 @@ class QuranAnalyzer(QWidget):
             return
         sure_no = int(sure_text.split('-')[0])  # "1-Fatiha" -> 1
 
-        # Önceki widget'ları temizle
-        for i in reversed(range(self.sol_layout.count())):
-            widget = self.sol_layout.itemAt(i).widget()
-            if widget:
-                widget.setParent(None)
-        for i in reversed(range(self.sag_layout.count())):
-            widget = self.sag_layout.itemAt(i).widget()
-            if widget:
-                widget.setParent(None)
-
         birinci_meal = self.birinci_meal_secici.currentText()
         ikinci_meal = self.ikinci_meal_secici.currentText()
-
-        # Birinci veri
-        if birinci_meal == self.secili_meal:
-            birinci_veri = self.veriler
-        else:
-            birinci_veri = veri_yukle(birinci_meal)
-
-        # İkinci veri
-        if ikinci_meal == self.secili_meal:
-            ikinci_veri = self.veriler
-        else:
-            ikinci_veri = veri_yukle(ikinci_meal)
+        birinci_veri = self.meal_verisi_getir(birinci_meal)
+        ikinci_veri = self.meal_verisi_getir(ikinci_meal)
+        ikinci_mealler = {i['ayet']: i.get('meal', '') for i in ikinci_veri if i['sure'] == sure_no}
 
         sure_ayetleri = [item for item in birinci_veri if item['sure'] == sure_no]
         sure_ayetleri.sort(key=lambda x: x['ayet'])
 
-        for item in sure_ayetleri:
-            ayet_no = item['ayet']
-            arapca = item.get('arapca', '')
-            birinci_meal_text = item.get('meal', '')
-
-            # Sol sütun - Birinci meal
-            html_sol = f"""
-            <div style='font-size:14px; font-weight:bold; margin-bottom:10px;'>
-                <span style='color:blue;'>Ayet {ayet_no}:</span><br>
-                <span style='font-size:16px;'>{arapca}</span><br>
-                <span style='color:green;'>{birinci_meal_text}</span>
+        # Kutular yalnızca görünür oldukça çizilir
+        self.sure_modeli.satirlari_ayarla([{
+            'sure': sure_no,
+            'ayet': item['ayet'],
+            'arapca': item.get('arapca', ''),
+            'sol': item.get('meal', ''),
+            'sag': ikinci_mealler.get(item['ayet'], "Meal bulunamadı"),
+            'sol_meal': birinci_meal,
+            'sag_meal': ikinci_meal,
+        } for item in sure_ayetleri])
+        self.sure_alani.scrollToTop()
+
+    def meal_verisi_getir(self, meal):
+        """Meal verisini bir kez yükler, sonraki çağrılarda bellekten döndürür"""
+        if meal == self.secili_meal:
+            return self.veriler
+        if meal not in self.meal_verileri:
+            if len(self.meal_verileri) >= 3:
+                # En eski yüklenen meali bellekten at
+                del self.meal_verileri[next(iter(self.meal_verileri))]
+            self.meal_verileri[meal] = veri_yukle(meal)
+        return self.meal_verileri[meal]
+
+    def sure_html_olustur(self, satir, taraf):
+        """Karşılaştırma görünümündeki bir kutunun HTML'ini önbellekten verir"""
+        if satir.get('sag') is None:
+            anahtar = ("tek", satir['sure'], satir['ayet'], satir['sol_meal'], ())
+        elif taraf == SOL:
+            anahtar = ("sol", satir['sure'], satir['ayet'], satir['sol_meal'], ())
+        else:
+            anahtar = ("sag", satir['sure'], satir['ayet'], satir['sag_meal'], ())
+        return self.html_onbellegi.getir(anahtar, lambda: self._sure_html_uret(satir, taraf))
+
+    def _sure_html_uret(self, satir, taraf):
+        if satir.get('sag') is None:
+            # Tek ayet görünümü
+            return f"""
+            <div style='font-size:16px; font-weight:bold; margin-bottom:10px;'>
+                <span style='color:blue;'>Süre {satir['sure']}, Ayet {satir['ayet']}:</span><br>
+                <span style='font-size:18px;'>{satir['arapca']}</span><br>
+                <span style='color:green;'>{satir['sol']}</span>
             </div>
             """
+        meal, renk = (satir['sol'], 'green') if taraf == SOL else (satir['sag'], 'red')
+        return f"""
+        <div style='font-size:14px; font-weight:bold; margin-bottom:10px;'>
+            <span style='color:blue;'>Ayet {satir['ayet']}:</span><br>
+            <span style='font-size:16px;'>{satir['arapca']}</span><br>
+            <span style='color:{renk};'>{meal}</span>
+        </div>
+        """
 
-            kutu_sol = QLabel()
-            kutu_sol.setWordWrap(True)
-            kutu_sol.setTextInteractionFlags(Qt.TextSelectableByMouse)
-            kutu_sol.setStyleSheet("""
-                QLabel {
-                    background-color: #f0f8ff;
-                    border: 1px solid #ddd;
-                    padding: 10px;
-                    margin-bottom: 5px;
-                    font-size: 12px;
-                }
-            """)
-            kutu_sol.setTextFormat(Qt.RichText)
-            kutu_sol.setText(html_sol)
-            widget_sol = QWidget()
-            layout_sol_v = QVBoxLayout()
-            layout_sol_v.addWidget(kutu_sol)
-            tts_btn_sol = QPushButton("🔊 Sesli Oku")
-            tts_btn_sol.clicked.connect(lambda checked, text=birinci_meal_text: self.speak_text(text))
-            layout_sol_v.addWidget(tts_btn_sol)
-            widget_sol.setLayout(layout_sol_v)
-            self.sol_layout.addWidget(widget_sol)
-
-            # Sağ sütun - İkinci meal
-            ikinci_item = next((i for i in ikinci_veri if i['sure'] == sure_no and i['ayet'] == ayet_no), None)
-            if ikinci_item:
-                ikinci_meal_text = ikinci_item.get('meal', '')
-            else:
-                ikinci_meal_text = "Meal bulunamadı"
-
-            html_sag = f"""
-            <div style='font-size:14px; font-weight:bold; margin-bottom:10px;'>
-                <span style='color:blue;'>Ayet {ayet_no}:</span><br>
-                <span style='font-size:16px;'>{arapca}</span><br>
-                <span style='color:red;'>{ikinci_meal_text}</span>
-            </div>
-            """
+    def sure_tarafi_sec(self, index):
+        """Tıklanan ayet kutusunun hangi meale ait olduğunu hatırlar"""
+        x = self.sure_alani.viewport().mapFromGlobal(QCursor.pos()).x()
+        self.sure_secili_taraf = self.sure_alani.itemDelegate().taraf(x)
 
-            kutu_sag = QLabel()
-            kutu_sag.setWordWrap(True)
-            kutu_sag.setTextInteractionFlags(Qt.TextSelectableByMouse)
-            kutu_sag.setStyleSheet("""
-                QLabel {
-                    background-color: #fff0f5;
-                    border: 1px solid #ddd;
-                    padding: 10px;
-                    margin-bottom: 5px;
-                    font-size: 12px;
-                }
-            """)
-            kutu_sag.setTextFormat(Qt.RichText)
-            kutu_sag.setText(html_sag)
-            widget_sag = QWidget()
-            layout_sag_v = QVBoxLayout()
-            layout_sag_v.addWidget(kutu_sag)
-            tts_btn_sag = QPushButton("🔊 Sesli Oku")
-            tts_btn_sag.clicked.connect(lambda checked, text=ikinci_meal_text: self.speak_text(text))
-            layout_sag_v.addWidget(tts_btn_sag)
-            widget_sag.setLayout(layout_sag_v)
-            self.sag_layout.addWidget(widget_sag)
+    def sure_surekli_oku(self):
+        """Görünümdeki sureyi seçili ayetten başlayarak ayet ayet okur"""
+        if self.sure_modeli.rowCount() == 0:
+            return
+        index = self.sure_alani.currentIndex()
+        baslangic = index.row() if index.isValid() else 0
+        ogeler = []
+        for row in range(baslangic, self.sure_modeli.rowCount()):
+            satir = self.sure_modeli.satir(row)
+            if self.sure_secili_taraf == SAG and satir.get('sag') is not None:
+                metin = satir['sag']
+            else:
+                metin = satir['sol']
+            ogeler.append((metin, ("sure", satir['sure'], row)))
+        self.ses_motoru.calma_listesi(ogeler, dil='tr')
+        self.ses_durum_label.setText("🔊 Hazırlanıyor...")
+        self.ses_durdur_btn.setEnabled(True)
+
+    def sure_sesli_oku(self):
+        """Karşılaştırma görünümünde seçili ayetin mealini sesli okur"""
+        index = self.sure_alani.currentIndex()
+        satir = self.sure_modeli.satir(index.row()) if index.isValid() else None
+        if not satir:
+            return
+        if self.sure_secili_taraf == SAG and satir.get('sag') is not None:
+            self.speak_text(satir['sag'])
+        else:
+            self.speak_text(satir['sol'])
 
     def kelime_listelerini_doldur(self):
-        """Kelime listelerini doldurur"""
-        # Türkçe kelimeler
-        self.turkce_liste.clear()
-        for kelime in self.kuran_kelimeleri.get("turkce", []):
-            siklik = self.kelime_sikliklari.get(normalize_text(kelime), 0)
-            self.turkce_liste.addItem(f"{kelime} ({siklik})")
+        """Kelime listelerini önek indeksi sırasındaki hazır dizilerle doldurur"""
+        # Türkçe kelimeler: sıklıklar normalize anahtarlar üzerinden bir kez hesaplanır
+        turkce_sikliklar = [self.kelime_sikliklari.get(a, 0) for a in self.turkce_onek_indeksi.anahtarlar]
+        self.turkce_kelime_modeli.kelimeleri_ayarla(self.turkce_onek_indeksi.kelimeler, turkce_sikliklar)
+        self.turkce_filtre.tumunu_goster()
 
         # Arapça kelimeler
-        self.arapca_liste.clear()
-        for kelime in self.kuran_kelimeleri.get("arapca", []):
-            self.arapca_liste.addItem(kelime)
+        self.arapca_kelime_modeli.kelimeleri_ayarla(self.arapca_onek_indeksi.kelimeler)
+        self.arapca_filtre.tumunu_goster()
 
     def turkce_kelime_ara(self, text):
         """Türkçe kelimelerde arama yapar (normal + kök tabanlı)"""
-        self.turkce_liste.clear()
         arama = text.lower().strip()
 
         if not arama:
             # Arama kutusu boşsa tüm kelimeleri göster
-            for kelime in self.kuran_kelimeleri.get("turkce", []):
-                siklik = self.kelime_sikliklari.get(normalize_text(kelime), 0)
-                self.turkce_liste.addItem(f"{kelime} ({siklik})")
-        else:
-            # Normalize edilmiş arama
-            arama_normalized = normalize_text(arama)
-            bulunan_kelimeler = set()
-            
-            # İlk olarak normalize edilmiş arama yap
-            for kelime in self.kuran_kelimeleri.get("turkce", []):
-                if arama_normalized in normalize_text(kelime):
-                    bulunan_kelimeler.add(kelime)
-            
-            # Eğer az sonuç bulunduysa, benzer kelimeler ekle
-            if len(bulunan_kelimeler) < 5:
-                benzer_kelimeler = difflib.get_close_matches(arama, self.kuran_kelimeleri.get("turkce", []), n=10, cutoff=0.6)
-                bulunan_kelimeler.update(benzer_kelimeler)
-            
-            # Kök tabanlı arama ekle (eğer Zemberek varsa ve checkbox işaretliyse)
-            if ZEMBEREK_AVAILABLE and self.kok_arama_checkbox.isChecked() and len(bulunan_kelimeler) < 10:
-                arama_koku = turkce_kok_bul(arama)
-                kok_eslesenler = kok_eslesmesi_bul(arama_koku, self.kuran_kelimeleri.get("turkce", []))
-                bulunan_kelimeler.update(kok_eslesenler)
-            
-            # Sonuçları listeye ekle
-            for kelime in sorted(bulunan_kelimeler):
-                siklik = self.kelime_sikliklari.get(normalize_text(kelime), 0)
-                self.turkce_liste.addItem(f"{kelime} ({siklik})")
+            self.turkce_filtre.tumunu_goster()
+            return
+
+        # Normalize edilmiş arama, önceden normalize edilmiş anahtarlar üzerinde
+        arama_normalized = normalize_text(arama)
+        anahtarlar = self.turkce_onek_indeksi.anahtarlar
+        bulunan_satirlar = {i for i, a in enumerate(anahtarlar) if arama_normalized in a}
+        bulunan_kelimeler = set()
+
+        # Eğer az sonuç bulunduysa, benzer kelimeler ekle
+        if len(bulunan_satirlar) < 5:
+            benzer_kelimeler = difflib.get_close_matches(arama, self.kuran_kelimeleri.get("turkce", []), n=10, cutoff=0.6)
+            bulunan_kelimeler.update(benzer_kelimeler)
+
+        # Kök tabanlı arama ekle (eğer Zemberek varsa ve checkbox işaretliyse)
+        if ZEMBEREK_AVAILABLE and self.kok_arama_checkbox.isChecked() and len(bulunan_satirlar) + len(bulunan_kelimeler) < 10:
+            arama_koku = turkce_kok_bul(arama)
+            kok_eslesenler = kok_eslesmesi_bul(arama_koku, self.kuran_kelimeleri.get("turkce", []))
+            bulunan_kelimeler.update(kok_eslesenler)
+
+        for kelime in bulunan_kelimeler:
+            satir = self.turkce_kelime_modeli.satir_no(kelime)
+            if satir is not None:
+                bulunan_satirlar.add(satir)
+        self.turkce_filtre.satirlari_ayarla(bulunan_satirlar)
 
     def arapca_kelime_ara(self, text):
         """Arapça kelimelerde arama yapar"""
-        self.arapca_liste.clear()
         arama = text.strip()
 
         if not arama:
             # Arama kutusu boşsa tüm kelimeleri göster
-            for kelime in self.kuran_kelimeleri.get("arapca", []):
-                self.arapca_liste.addItem(kelime)
-        else:
-            # Normalize edilmiş arama
-            arama_normalized = normalize_arabic(arama)
-            bulunan_kelimeler = set()
-            
-            # İlk olarak normalize edilmiş arama yap
-            for kelime in self.kuran_kelimeleri.get("arapca", []):
-                if arama_normalized in normalize_arabic(kelime):
-                    bulunan_kelimeler.add(kelime)
-            
-            # Eğer az sonuç bulunduysa, benzer kelimeler ekle
-            if len(bulunan_kelimeler) < 5:
-                benzer_kelimeler = difflib.get_close_matches(arama, self.kuran_kelimeleri.get("arapca", []), n=10, cutoff=0.6)
-                bulunan_kelimeler.update(benzer_kelimeler)
-            
-            # Sonuçları listeye ekle
-            for kelime in sorted(bulunan_kelimeler):
-                self.arapca_liste.addItem(kelime)
+            self.arapca_filtre.tumunu_goster()
+            return
+
+        # Normalize edilmiş arama, önceden normalize edilmiş anahtarlar üzerinde
+        arama_normalized = normalize_arabic(arama)
+        anahtarlar = self.arapca_onek_indeksi.anahtarlar
+        bulunan_satirlar = {i for i, a in enumerate(anahtarlar) if arama_normalized in a}
+
+        # Eğer az sonuç bulunduysa, benzer kelimeler ekle
+        if len(bulunan_satirlar) < 5:
+            benzer_kelimeler = difflib.get_close_matches(arama, self.kuran_kelimeleri.get("arapca", []), n=10, cutoff=0.6)
+            for kelime in benzer_kelimeler:
+                satir = self.arapca_kelime_modeli.satir_no(kelime)
+                if satir is not None:
+                    bulunan_satirlar.add(satir)
+        self.arapca_filtre.satirlari_ayarla(bulunan_satirlar)
+
+    def _secili_metinler(self, liste):
+        """Liste görünümündeki seçili satırların metinlerini sırayla döndürür"""
+        indeksler = sorted(liste.selectionModel().selectedIndexes(), key=lambda i: i.row())
+        return [i.data(Qt.DisplayRole) for i in indeksler]
 
     def turkce_liste_sag_tik(self, position):
         """Türkçe kelime listesi için sağ tıklama menüsü"""
-        selected_items = self.turkce_liste.selectedItems()
+        selected_items = self._secili_metinler(self.turkce_liste)
         if not selected_items:
             return
 
@@ -1646,7 +1580,7 @@ class QuranAnalyzer(QWidget):
 
     def arapca_liste_sag_tik(self, position):
         """Arapça kelime listesi için sağ tıklama menüsü"""
-        selected_items = self.arapca_liste.selectedItems()
+        selected_items = self._secili_metinler(self.arapca_liste)
         if not selected_items:
             return
 
@@ -1662,81 +1596,56 @@ class QuranAnalyzer(QWidget):
 
     def turkce_harf_filtresi(self, harf):
         """Türkçe kelimeleri harf bazlı filtreler"""
-        self.turkce_liste.clear()
         self.turkce_arama_kutusu.clear()  # Arama kutusunu temizle
-        
-        for kelime in self.kuran_kelimeleri.get("turkce", []):
-            if kelime.lower().startswith(harf.lower()):
-                siklik = self.kelime_sikliklari.get(normalize_text(kelime), 0)
-                self.turkce_liste.addItem(f"{kelime} ({siklik})")
+        # Model önek indeksi sırasında olduğu için harf aralığı ardışık satırlardır
+        self.turkce_filtre.aralik_ayarla(*self.turkce_onek_indeksi.aralik(harf))
 
     def turkce_tum_kelimeleri_goster(self):
         """Türkçe tüm kelimeleri gösterir"""
-        self.turkce_liste.clear()
         self.turkce_arama_kutusu.clear()
-        
-        for kelime in self.kuran_kelimeleri.get("turkce", []):
-            siklik = self.kelime_sikliklari.get(normalize_text(kelime), 0)
-            self.turkce_liste.addItem(f"{kelime} ({siklik})")
+        self.turkce_filtre.tumunu_goster()
 
     def arapca_harf_filtresi(self, harf):
         """Arapça kelimeleri harf bazlı filtreler"""
-        self.arapca_liste.clear()
         self.arapca_arama_kutusu.clear()  # Arama kutusunu temizle
-        
-        for kelime in self.kuran_kelimeleri.get("arapca", []):
-            if kelime.startswith(harf):
-                self.arapca_liste.addItem(kelime)
+        self.arapca_filtre.aralik_ayarla(*self.arapca_onek_indeksi.aralik(harf))
 
     def arapca_tum_kelimeleri_goster(self):
         """Arapça tüm kelimeleri gösterir"""
-        self.arapca_liste.clear()
         self.arapca_arama_kutusu.clear()
-        
-        for kelime in self.kuran_kelimeleri.get("arapca", []):
-            self.arapca_liste.addItem(kelime)
+        self.arapca_filtre.tumunu_goster()
 
     def turkce_kelime_kopyala(self):
         """Seçili Türkçe kelimeyi panoya kopyalar"""
-        current_item = self.turkce_liste.currentItem()
-        if current_item:
+        current_index = self.turkce_liste.currentIndex()
+        if current_index.isValid():
             clipboard = QApplication.clipboard()
-            clipboard.setText(current_item.text())
+            clipboard.setText(current_index.data(Qt.DisplayRole))
 
     def arapca_kelime_kopyala(self):
         """Seçili Arapça kelimeyi panoya kopyalar"""
-        current_item = self.arapca_liste.currentItem()
-        if current_item:
+        current_index = self.arapca_liste.currentIndex()
+        if current_index.isValid():
             clipboard = QApplication.clipboard()
-            clipboard.setText(current_item.text())
+            clipboard.setText(current_index.data(Qt.DisplayRole))
 
     def turkce_kelimeleri_kopyala(self):
         """Seçili Türkçe kelimeleri panoya kopyalar"""
-        selected_items = self.turkce_liste.selectedItems()
-        if selected_items:
-            kelimeler = [item.text() for item in selected_items]
+        kelimeler = self._secili_metinler(self.turkce_liste)
+        if kelimeler:
             clipboard = QApplication.clipboard()
             clipboard.setText('\n'.join(kelimeler))
 
     def arapca_kelimeleri_kopyala(self):
         """Seçili Arapça kelimeleri panoya kopyalar"""
-        selected_items = self.arapca_liste.selectedItems()
-        if selected_items:
-            kelimeler = [item.text() for item in selected_items]
+        kelimeler = self._secili_metinler(self.arapca_liste)
+        if kelimeler:
             clipboard = QApplication.clipboard()
             clipboard.setText('\n'.join(kelimeler))
 
-    def turkce_kelime_detay(self, item):
+    def turkce_kelime_detay(self, index):
         """Türkçe kelimeye çift tıklayınca detay dialog'u açar"""
-        kelime_text = item.text()
-        
-        # Sıklık göstergesini ayır (örn: "kelime (5)" -> "kelime")
-        if " (" in kelime_text and kelime_text.endswith(")"):
-            parantez_index = kelime_text.rfind(" (")
-            kelime = kelime_text[:parantez_index]
-        else:
-            kelime = kelime_text
-            
+        kelime = index.data(KELIME_ROLU)
         normalized_kelime = normalize_text(kelime)
         
         # Kelime bazlı veriyi yükle
@@ -1842,9 +1751,9 @@ class QuranAnalyzer(QWidget):
         dialog.setLayout(layout)
         dialog.exec_()
 
-    def arapca_kelime_detay(self, item):
+    def arapca_kelime_detay(self, index):
         """Arapça kelimeye çift tıklayınca detay dialog'u açar"""
-        kelime = item.text()
+        kelime = index.data(KELIME_ROLU)
         normalized_kelime = normalize_arabic(kelime)
         
         # Kelime bazlı veriyi yükle
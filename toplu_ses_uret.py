@@ -0,0 +1,142 @@
+# kuran_veri_analiz/toplu_ses_uret.py
+"""Sureler veya tüm mealler için sesleri önceden üretip ses önbelleğine yazar.
+
+Örnekler:
+    python toplu_ses_uret.py --sure 1 36 67
+    python toplu_ses_uret.py --tum --meal "Elmalılı Hamdi Yazır Meali" --isci 4
+    python toplu_ses_uret.py --sure 2 --dil ar --motor espeak-ng
+
+Bir ayet, tüm parçaları seçili motor ve sesle önbellekte bulunuyorsa
+tamamlanmış sayılır; yarıda kalan iş aynı komutla yeniden çalıştırıldığında
+kaldığı yerden devam eder. --azami-mb verilirse sınır önbellek klasörüne
+yazılır ve uygulamalar da aynı sınırı kullanır.
+"""
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from utils.veri_isleyici import veri_yukle
+from utils.metin_bolucu import ses_parcalari
+from utils.ses_onbellegi import SesOnbellegi, varsayilan_onbellek_klasoru
+from utils.tts_motorlari import MOTORLAR, motor_olustur
+
+
+def is_listesi(veriler, sureler, dil):
+    """(kimlik, metin) çiftlerini sure/ayet sırasıyla döndürür"""
+    for item in sorted(veriler, key=lambda v: (v['sure'], v['ayet'])):
+        if sureler and item['sure'] not in sureler:
+            continue
+        metin = item.get('meal', '') if dil == 'tr' else item.get('arapca', '').strip()
+        if metin and metin.strip():
+            yield f"{item['sure']}:{item['ayet']}", metin
+
+
+def onbellekte_mi(onbellek, motor, metin, dil):
+    """Ayetin tüm parçaları bu motor ve sesle önbellekte varsa True"""
+    return all(onbellek.getir(parca, dil, motor.ad, motor.ses, motor.uzanti)
+               for parca in ses_parcalari(metin, dil))
+
+
+def sentezle_tekrarla(onbellek, motor, metin, dil, deneme, bekleme):
+    """Ayetin parçalarını sentezler; başarısız parçayı artan beklemeyle `deneme` kez tekrarlar"""
+    # Parçalar uygulamaların çaldığı anahtarlarla aynıdır (meal cümleleri, Arapça tek parça)
+    for parca in ses_parcalari(metin, dil):
+        for i in range(deneme):
+            try:
+                onbellek.getir_veya_olustur(
+                    parca, dil, motor.ad, lambda hedef: motor.sentezle(parca, dil, hedef),
+                    ses=motor.ses, uzanti=motor.uzanti)
+                break
+            except Exception:
+                if i == deneme - 1:
+                    raise
+                time.sleep(bekleme * (2 ** i))
+
+
+def calistir(args):
+    motor = motor_olustur(args.motor, args.ses)
+    if not motor.kullanilabilir():
+        print(f"'{motor.ad}' motoru bu sistemde kullanılamıyor.", file=sys.stderr)
+        return 2
+
+    onbellek = SesOnbellegi(args.onbellek)
+    if args.azami_mb:
+        onbellek.sinir_kaydet(args.azami_mb * 1024 * 1024)
+
+    veriler = veri_yukle(args.meal)
+    sureler = set(args.sure) if args.sure else None
+    tum_isler = list(is_listesi(veriler, sureler, args.dil))
+    isler = [(k, m) for k, m in tum_isler if not onbellekte_mi(onbellek, motor, m, args.dil)]
+    toplam = len(isler)
+    print(f"{toplam} ayet sentezlenecek ({len(tum_isler) - toplam} ayet zaten önbellekte, "
+          f"sınır {onbellek.azami_boyut // (1024 * 1024)} MB).")
+    if not isler:
+        return 0
+
+    sayac = {"bitti": 0, "hata": 0}
+    hatalar = []
+    baslangic = time.time()
+
+    with ThreadPoolExecutor(max_workers=args.isci) as havuz:
+        kalan = iter(isler)
+        calisan = {}
+
+        def gonder(adet):
+            for kimlik, metin in kalan:
+                gelecek = havuz.submit(sentezle_tekrarla, onbellek, motor, metin,
+                                       args.dil, args.deneme, args.bekleme)
+                calisan[gelecek] = kimlik
+                adet -= 1
+                if adet == 0:
+                    break
+
+        # Bellekte en fazla isci*2 iş bekletilir
+        gonder(args.isci * 2)
+        while calisan:
+            biten, _ = wait(calisan, return_when=FIRST_COMPLETED)
+            for gelecek in biten:
+                kimlik = calisan.pop(gelecek)
+                try:
+                    gelecek.result()
+                    sayac["bitti"] += 1
+                except Exception as e:
+                    sayac["hata"] += 1
+                    hatalar.append((kimlik, str(e)))
+                islenen = sayac["bitti"] + sayac["hata"]
+                if islenen % 50 == 0 or islenen == toplam:
+                    gecen = time.time() - baslangic
+                    print(f"  {islenen}/{toplam} ayet, {sayac['hata']} hata, {gecen:.1f} sn")
+            gonder(len(biten))
+
+    for kimlik, hata in hatalar[:20]:
+        print(f"  Hata {kimlik}: {hata}", file=sys.stderr)
+    if onbellek.silinen:
+        print(f"Uyarı: önbellek sınırı aşıldı, {onbellek.silinen} eski ses dosyası silindi; "
+              f"tüm sesleri tutmak için --azami-mb ile sınırı artırın.", file=sys.stderr)
+    print(f"Tamamlandı: {sayac['bitti']} ayet, {sayac['hata']} hata, {time.time() - baslangic:.1f} sn")
+    return 1 if sayac["hata"] else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ayet sesleri için toplu önbellek üretimi")
+    hedef = parser.add_mutually_exclusive_group(required=True)
+    hedef.add_argument("--sure", type=int, nargs="+", help="Üretilecek sure numaraları")
+    hedef.add_argument("--tum", action="store_true", help="Tüm ayetler (6236)")
+    parser.add_argument("--meal", default="Diyanet İşleri Meali (Yeni)")
+    parser.add_argument("--dil", choices=["tr", "ar"], default="tr",
+                        help="tr: meal metni, ar: Arapça metin")
+    parser.add_argument("--motor", choices=sorted(MOTORLAR), default=None,
+                        help="TTS motoru (varsayılan: KURAN_TTS_MOTORU veya gtts)")
+    parser.add_argument("--ses", default="", help="Motorun ses (voice) kimliği")
+    parser.add_argument("--isci", type=int, default=4, help="Eşzamanlı sentez sayısı")
+    parser.add_argument("--deneme", type=int, default=3, help="Ayet başına deneme sayısı")
+    parser.add_argument("--bekleme", type=float, default=1.0, help="İlk tekrar öncesi bekleme (sn)")
+    parser.add_argument("--onbellek", default=varsayilan_onbellek_klasoru())
+    parser.add_argument("--azami-mb", type=int, default=None,
+                        help="Önbellek boyut sınırı (MB); verilirse uygulamalar için de kaydedilir")
+    return calistir(parser.parse_args(argv))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
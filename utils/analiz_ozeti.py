@@ -0,0 +1,84 @@
+# utils/analiz_ozeti.py
+"""Korpus analiz özeti: veri hazırlanırken bir kez hesaplanıp veriler/ altına yazılır.
+
+    python -m utils.analiz_ozeti   # özeti yeniden oluşturur
+
+Özet, kaynak JSON dosyasının boyutu ve değişiklik zamanıyla birlikte saklanır;
+kaynak değişmişse analiz_ozeti_yukle() özeti yeniden üretir.
+"""
+import json
+import os
+import re
+from collections import Counter
+
+from utils.dosya_islemleri import atomik_yaz
+
+VERI_KLASORU = os.path.join(os.path.dirname(__file__), "../veriler")
+KAYNAK_DOSYA = os.path.join(VERI_KLASORU, "kelime_manali_kuran_ve_turkce_meali.json")
+OZET_DOSYASI = os.path.join(VERI_KLASORU, "analiz_ozeti.json")
+OZET_SURUMU = 1
+EN_SIK_ADET = 50
+
+_KELIME = re.compile(r'\b\w+\b')
+
+
+def _kaynak_imzasi(yol):
+    st = os.stat(yol)
+    return {"boyut": st.st_size, "mtime": int(st.st_mtime)}
+
+
+def analiz_ozeti_hesapla(veriler):
+    """Sure başına ayet sayıları, dil başına en sık kelimeler ve uzunlukları hesaplar"""
+    sure_ayet_sayilari = Counter(ayet['sure'] for ayet in veriler)
+    # Metinler birleştirilip tek regex geçişiyle kelimelere ayrılır
+    turkce = _KELIME.findall("\n".join(ayet.get('turkce', '') for ayet in veriler).lower())
+    arapca = _KELIME.findall("\n".join(ayet.get('arapca', '') for ayet in veriler))
+    toplam_ayet = len(veriler)
+    return {
+        "toplam_ayet": toplam_ayet,
+        "sure_ayet_sayilari": {str(s): n for s, n in sorted(sure_ayet_sayilari.items())},
+        "toplam_kelime_turkce": len(turkce),
+        "toplam_kelime_arapca": len(arapca),
+        "ortalama_kelime_ayet_turkce": len(turkce) / toplam_ayet if toplam_ayet else 0,
+        "ortalama_kelime_ayet_arapca": len(arapca) / toplam_ayet if toplam_ayet else 0,
+        "en_sik_turkce": Counter(turkce).most_common(EN_SIK_ADET),
+        "en_sik_arapca": Counter(arapca).most_common(EN_SIK_ADET),
+    }
+
+
+def analiz_ozeti_olustur(kaynak=KAYNAK_DOSYA, hedef=OZET_DOSYASI):
+    """Kaynak veriden özeti üretip hedef dosyaya atomik olarak yazar"""
+    with open(kaynak, "r", encoding="utf-8") as f:
+        veriler = json.load(f)
+    ozet = analiz_ozeti_hesapla(veriler)
+    ozet["surum"] = OZET_SURUMU
+    ozet["kaynak"] = _kaynak_imzasi(kaynak)
+
+    def yaz(yol):
+        with open(yol, "w", encoding="utf-8") as f:
+            json.dump(ozet, f, ensure_ascii=False)
+    atomik_yaz(hedef, yaz)
+    return ozet
+
+
+def analiz_ozeti_yukle(kaynak=KAYNAK_DOSYA, hedef=OZET_DOSYASI):
+    """Özeti dosyadan okur; yoksa, eskiyse veya sürümü farklıysa yeniden oluşturur"""
+    try:
+        with open(hedef, "r", encoding="utf-8") as f:
+            ozet = json.load(f)
+        if ozet.get("surum") == OZET_SURUMU and ozet.get("kaynak") == _kaynak_imzasi(kaynak):
+            return ozet
+    except (OSError, ValueError):
+        pass
+    try:
+        return analiz_ozeti_olustur(kaynak, hedef)
+    except OSError:
+        # Veri klasörü yazılamıyorsa özet yalnızca bellekte kullanılır
+        with open(kaynak, "r", encoding="utf-8") as f:
+            return analiz_ozeti_hesapla(json.load(f))
+
+
+if __name__ == "__main__":
+    ozet = analiz_ozeti_olustur()
+    print(f"{OZET_DOSYASI} yazıldı: {ozet['toplam_ayet']} ayet, "
+          f"{len(ozet['sure_ayet_sayilari'])} sure")
@@ -0,0 +1,64 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+
+class ArkaPlanIsleri(QObject):
+    """Ağır hesapları (graf yerleşimi, kelime bulutu) iş havuzunda çalıştırır.
+
+    Her iş bir türe (ör. "ag", "bulut") aittir; aynı türde yeni iş
+    gönderildiğinde önceki iş henüz başlamadıysa iptal edilir, başladıysa
+    sonucu yok sayılır. Sonuç arayüz iş parçacığına `hazir` sinyaliyle gelir.
+    """
+
+    hazir = pyqtSignal(str, object, object)   # tür, bağlam, sonuç
+    hata = pyqtSignal(str, object, str)       # tür, bağlam, hata mesajı
+    _tamamlandi = pyqtSignal(str, int, object, object, object)  # havuzdan arayüze
+
+    def __init__(self, parent=None, isci=2):
+        super().__init__(parent)
+        self._havuz = ThreadPoolExecutor(max_workers=isci)
+        self._nesil = {}      # tür -> son gönderilen işin numarası
+        self._gelecekler = {}  # tür -> Future
+        self._tamamlandi.connect(self._sonucu_ilet)
+
+    def gonder(self, tur, baglam, fonksiyon, *args):
+        """fonksiyon(*args) sonucunu `hazir` ile bildirir; aynı türün eski işini iptal eder"""
+        nesil = self._nesil.get(tur, 0) + 1
+        self._nesil[tur] = nesil
+        eski = self._gelecekler.pop(tur, None)
+        if eski is not None:
+            eski.cancel()
+
+        gelecek = self._havuz.submit(fonksiyon, *args)
+        self._gelecekler[tur] = gelecek
+        gelecek.add_done_callback(lambda g: self._bitti(tur, nesil, baglam, g))
+
+    def iptal(self, tur):
+        """Türün bekleyen işini iptal eder; çalışan işin sonucu yok sayılır"""
+        self._nesil[tur] = self._nesil.get(tur, 0) + 1
+        eski = self._gelecekler.pop(tur, None)
+        if eski is not None:
+            eski.cancel()
+
+    def _bitti(self, tur, nesil, baglam, gelecek):
+        # Havuz iş parçacığında çağrılır; sinyal arayüz iş parçacığına kuyruklanır
+        if gelecek.cancelled() or self._nesil.get(tur) != nesil:
+            return
+        hata = gelecek.exception()
+        self._tamamlandi.emit(tur, nesil, baglam, None if hata else gelecek.result(), hata)
+
+    def _sonucu_ilet(self, tur, nesil, baglam, sonuc, hata):
+        # Kuyrukta beklerken daha yeni bir iş gönderildiyse sonuç çizilmez
+        if self._nesil.get(tur) != nesil:
+            return
+        self._gelecekler.pop(tur, None)
+        if hata is not None:
+            self.hata.emit(tur, baglam, str(hata))
+        else:
+            self.hazir.emit(tur, baglam, sonuc)
+
+    def kapat(self):
+        for tur in list(self._gelecekler):
+            self.iptal(tur)
+        self._havuz.shutdown(wait=False)
@@ -0,0 +1,79 @@
+import numpy as np
+
+
+class BenzerAyetMotoru:
+    """Kök TF-IDF vektörleriyle en benzer ayetleri bulan motor.
+
+    Her ayet, köklerinin (1 + log tf) * idf ağırlıklarından oluşan birim
+    uzunlukta seyrek bir vektördür. Ters dizin (kök → ayetler) üzerinden
+    yalnızca sorguyla ortak kökü olan ayetlerin kosinüs skorları toplanır;
+    en yüksek k skor argpartition ile seçilir.
+    """
+
+    def __init__(self, kelimeler):
+        kayitlar = [((w['sureNo'], w['ayetNo']), w['kok'].strip())
+                    for w in kelimeler if (w.get('kok') or '').strip()]
+        self.ayetler = sorted({a for a, _ in kayitlar})
+        self.ayet_no = {a: i for i, a in enumerate(self.ayetler)}
+        self.kokler = sorted({k for _, k in kayitlar})
+        self.kok_no = {k: i for i, k in enumerate(self.kokler)}
+
+        n_kok = max(1, len(self.kokler))
+        kodlar = np.fromiter((self.ayet_no[a] * n_kok + self.kok_no[k] for a, k in kayitlar),
+                             dtype=np.int64, count=len(kayitlar))
+        kodlar, tf = np.unique(kodlar, return_counts=True)
+        ayet, kok = kodlar // n_kok, kodlar % n_kok
+
+        n_ayet = len(self.ayetler)
+        df = np.bincount(kok, minlength=len(self.kokler))
+        self.idf = np.log((1 + n_ayet) / (1 + df)) + 1.0
+        agirlik = (1.0 + np.log(tf)) * self.idf[kok]
+        norm = np.sqrt(np.bincount(ayet, weights=agirlik ** 2, minlength=n_ayet))
+        agirlik = agirlik / norm[ayet]
+
+        # Ayet satırları (kodlar ayet sırasıyla geldiği için zaten sıralı)
+        self.ayet_ptr = np.concatenate([[0], np.cumsum(np.bincount(ayet, minlength=n_ayet))])
+        self.ayet_kok = kok.astype(np.int32)
+        self.ayet_agirlik = agirlik
+
+        # Ters dizin: kök → (ayetler, ağırlıklar)
+        sira = np.argsort(kok, kind="stable")
+        self.kok_ptr = np.concatenate([[0], np.cumsum(df)])
+        self.kok_ayet = ayet[sira].astype(np.int32)
+        self.kok_agirlik = agirlik[sira]
+
+    def benzerler(self, sure, ayet, k=10):
+        """(sure, ayet, benzerlik) üçlülerini azalan benzerlikle döndürür"""
+        i = self.ayet_no.get((sure, ayet))
+        if i is None:
+            return []
+        bas, son = self.ayet_ptr[i], self.ayet_ptr[i + 1]
+        sorgu_kok, sorgu_agirlik = self.ayet_kok[bas:son], self.ayet_agirlik[bas:son]
+
+        # Yalnızca ortak kökü olan ayetlerin postaları toplanır
+        parcalar = [(self.kok_ayet[self.kok_ptr[t]:self.kok_ptr[t + 1]],
+                     self.kok_agirlik[self.kok_ptr[t]:self.kok_ptr[t + 1]] * w)
+                    for t, w in zip(sorgu_kok, sorgu_agirlik)]
+        if not parcalar:
+            return []
+        adaylar = np.concatenate([p[0] for p in parcalar])
+        katkilar = np.concatenate([p[1] for p in parcalar])
+        adaylar, ters = np.unique(adaylar, return_inverse=True)
+        skorlar = np.bincount(ters, weights=katkilar)
+        skorlar[adaylar == i] = -1.0  # ayetin kendisi
+
+        k = min(k, len(adaylar))
+        if k <= 0:
+            return []
+        secim = np.argpartition(-skorlar, k - 1)[:k]
+        secim = secim[np.argsort(-skorlar[secim], kind="stable")]
+        return [(*self.ayetler[adaylar[j]], float(skorlar[j])) for j in secim if skorlar[j] > 0]
+
+    def ortak_kokler(self, a1, a2):
+        """İki ayetin ortak köklerini döndürür"""
+        def kokler(a):
+            i = self.ayet_no.get(a)
+            if i is None:
+                return set()
+            return set(self.ayet_kok[self.ayet_ptr[i]:self.ayet_ptr[i + 1]].tolist())
+        return sorted(self.kokler[t] for t in kokler(a1) & kokler(a2))
@@ -0,0 +1,83 @@
+import os
+import threading
+
+from utils.dosya_islemleri import gecici_mi
+
+
+class DiskOnbellegi:
+    """Toplam boyutu sınırlı kalıcı önbellek klasörü için ortak temel.
+
+    Alt sınıflar UZANTILAR ile hangi dosyaların sayılıp silineceğini belirler;
+    yazılmakta olan geçici dosyalar ve diğer dosyalar hiç dokunulmadan kalır.
+    Okunan kayıtların mtime'ı güncellenir; sınır aşılınca en uzun süre
+    kullanılmayan dosyalar, yeni yazılan dosya hariç, silinir.
+    """
+
+    UZANTILAR = ()
+
+    def __init__(self, klasor, azami_boyut):
+        self.klasor = klasor
+        self.azami_boyut = azami_boyut
+        self._kilit = threading.Lock()
+        self._toplam_boyut = None  # ilk yazmada hesaplanır
+        self.silinen = 0  # sınır nedeniyle silinen dosya sayısı
+        os.makedirs(self.klasor, exist_ok=True)
+
+    @staticmethod
+    def _kullanildi(yol):
+        """Dosyanın kullanım zamanını günceller; dosya yoksa False"""
+        try:
+            os.utime(yol)
+        except OSError:
+            return False
+        return True
+
+    def _dosyalar(self):
+        # Geçici (yazılmakta olan) dosyalar ve önbelleğe ait olmayan dosyalar sayılmaz, silinmez
+        for kok, _, dosyalar in os.walk(self.klasor):
+            for ad in dosyalar:
+                if gecici_mi(ad) or not ad.endswith(self.UZANTILAR):
+                    continue
+                yol = os.path.join(kok, ad)
+                try:
+                    st = os.stat(yol)
+                except OSError:
+                    continue
+                yield yol, st.st_size, st.st_mtime
+
+    def toplam_boyut(self):
+        return sum(boyut for _, boyut, _ in self._dosyalar())
+
+    def _eklendi(self, yol):
+        """Yeni yazılan dosyayı toplama ekler, sınır aşıldıysa eski dosyaları siler"""
+        boyut = os.path.getsize(yol)
+        with self._kilit:
+            if self._toplam_boyut is None:
+                self._toplam_boyut = self.toplam_boyut()
+            else:
+                self._toplam_boyut += boyut
+            if self._toplam_boyut > self.azami_boyut:
+                # Yeni dosya çağırana döndürüleceği için boşaltmada silinmez
+                self._toplam_boyut = self._bosalt(int(self.azami_boyut * 0.9), koru=yol)
+
+    def _bosalt(self, hedef_boyut, koru=None):
+        """En eski kullanılan dosyaları (koru hariç) hedef boyuta inene kadar siler"""
+        dosyalar = sorted(self._dosyalar(), key=lambda d: d[2])
+        toplam = sum(boyut for _, boyut, _ in dosyalar)
+        for yol, boyut, _ in dosyalar:
+            if toplam <= hedef_boyut:
+                break
+            if yol == koru:
+                continue
+            try:
+                os.remove(yol)
+                toplam -= boyut
+                self.silinen += 1
+            except OSError:
+                pass
+        return toplam
+
+    def temizle(self):
+        """Önbellekteki tüm dosyaları siler"""
+        with self._kilit:
+            self._toplam_boyut = self._bosalt(0)
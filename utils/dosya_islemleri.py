@@ -0,0 +1,33 @@
+import os
+import tempfile
+
+# Yazılmakta olan geçici dosyaların adı bu önekle başlar; klasörü tarayan
+# kodlar (ör. ses önbelleğinin boyut hesabı) bu dosyaları atlar
+GECICI_ONEK = ".yaziliyor-"
+
+
+def gecici_mi(ad):
+    """Dosya adı atomik_yaz'ın geçici dosyasına aitse True"""
+    return os.path.basename(ad).startswith(GECICI_ONEK)
+
+
+def atomik_yaz(yol, yaz):
+    """yaz(gecici_yol) ile aynı klasörde geçici dosyaya yazar ve yerine taşır.
+
+    Okuyucular hiçbir zaman yarım yazılmış dosya görmez; hata olursa
+    (KeyboardInterrupt dahil) geçici dosya silinip hata yeniden fırlatılır.
+    """
+    klasor = os.path.dirname(yol) or "."
+    os.makedirs(klasor, exist_ok=True)
+    fd, gecici = tempfile.mkstemp(prefix=GECICI_ONEK, suffix=os.path.splitext(yol)[1], dir=klasor)
+    os.close(fd)
+    try:
+        yaz(gecici)
+        os.replace(gecici, yol)
+    except BaseException:
+        try:
+            os.remove(gecici)
+        except OSError:
+            pass
+        raise
+    return yol
@@ -0,0 +1,102 @@
+import json
+import os
+import sqlite3
+import time
+
+
+class FavoriDeposu:
+    """Favori ayetleri (sure, ayet) anahtarlarıyla SQLite'ta tutan depo.
+
+    Üyelik sorgusu bellekteki kümeden yapılır; her ekleme/çıkarma tek satırlık
+    bir işlemle (transaction) yazılır, dosyanın tamamı yeniden yazılmaz.
+    Eski favorites.json (ayet sözlükleri veya "sure/ayet" dizeleri) ilk
+    açılışta bir kez içe aktarılır.
+    """
+
+    def __init__(self, yol="favoriler.db", eski_json="favorites.json"):
+        self.yol = yol
+        self._baglanti = sqlite3.connect(yol)
+        self._baglanti.execute("PRAGMA journal_mode=WAL")
+        self._baglanti.execute("PRAGMA synchronous=NORMAL")
+        with self._baglanti:
+            self._baglanti.execute("""
+                CREATE TABLE IF NOT EXISTS favoriler (
+                    sure    INTEGER NOT NULL,
+                    ayet    INTEGER NOT NULL,
+                    eklenme REAL    NOT NULL,
+                    PRIMARY KEY (sure, ayet)
+                ) WITHOUT ROWID
+            """)
+            self._baglanti.execute(
+                "CREATE TABLE IF NOT EXISTS ayarlar (anahtar TEXT PRIMARY KEY, deger TEXT)")
+        if eski_json:
+            self._json_tasi(eski_json)
+        self._kume = set(self._baglanti.execute("SELECT sure, ayet FROM favoriler"))
+
+    def _json_tasi(self, json_yolu):
+        """favorites.json içeriğini bir kez, tek işlemde tabloya aktarır"""
+        tasindi = self._baglanti.execute(
+            "SELECT 1 FROM ayarlar WHERE anahtar = 'json_tasindi'").fetchone()
+        if tasindi or not os.path.exists(json_yolu):
+            return
+        try:
+            with open(json_yolu, 'r', encoding='utf-8') as f:
+                eski = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        anahtarlar = []
+        for oge in eski if isinstance(eski, list) else []:
+            try:
+                if isinstance(oge, dict):
+                    anahtarlar.append((int(oge['sure']), int(oge['ayet'])))
+                else:
+                    sure, ayet = str(oge).split('/')
+                    anahtarlar.append((int(sure), int(ayet)))
+            except (KeyError, ValueError):
+                continue
+
+        simdi = time.time()
+        with self._baglanti:
+            self._baglanti.executemany(
+                "INSERT OR IGNORE INTO favoriler (sure, ayet, eklenme) VALUES (?, ?, ?)",
+                [(s, a, simdi) for s, a in anahtarlar])
+            self._baglanti.execute(
+                "INSERT OR REPLACE INTO ayarlar (anahtar, deger) VALUES ('json_tasindi', ?)",
+                (json_yolu,))
+
+    def __contains__(self, anahtar):
+        sure, ayet = anahtar
+        return (int(sure), int(ayet)) in self._kume
+
+    def __len__(self):
+        return len(self._kume)
+
+    def __iter__(self):
+        return iter(sorted(self._kume))
+
+    def ekle(self, sure, ayet):
+        """Ayeti ekler; zaten favorideyse False döndürür"""
+        anahtar = (int(sure), int(ayet))
+        if anahtar in self._kume:
+            return False
+        with self._baglanti:
+            self._baglanti.execute(
+                "INSERT OR IGNORE INTO favoriler (sure, ayet, eklenme) VALUES (?, ?, ?)",
+                (*anahtar, time.time()))
+        self._kume.add(anahtar)
+        return True
+
+    def cikar(self, sure, ayet):
+        """Ayeti favorilerden çıkarır; favoride değilse False döndürür"""
+        anahtar = (int(sure), int(ayet))
+        if anahtar not in self._kume:
+            return False
+        with self._baglanti:
+            self._baglanti.execute(
+                "DELETE FROM favoriler WHERE sure = ? AND ayet = ?", anahtar)
+        self._kume.discard(anahtar)
+        return True
+
+    def kapat(self):
+        self._baglanti.close()
@@ -0,0 +1,92 @@
+import hashlib
+import json
+import os
+
+import numpy as np
+
+from utils.disk_onbellegi import DiskOnbellegi
+from utils.dosya_islemleri import atomik_yaz
+from utils.lru_onbellek import LRUOnbellek
+
+
+def varsayilan_grafik_klasoru():
+    """Kullanıcı dizininde kalıcı grafik önbelleği klasörünü döndürür"""
+    return os.path.join(os.path.expanduser("~"), ".kuran_veri_analizi", "grafik_onbellegi")
+
+
+class GrafikOnbellegi(DiskOnbellegi):
+    """Kavram ağı düğüm konumları ve kelime bulutu görüntüleri için önbellek.
+
+    Anahtar (tür, sure, ayet, boyut) ile girdinin özetinden üretilir; veri
+    değişirse eski kayıt kendiliğinden geçersiz kalır. Bellekte konumlar kayıt
+    sayısıyla, görüntüler (her biri ~1 MB) bayt toplamıyla sınırlı ayrı LRU'larda;
+    diskte konumlar JSON, görüntüler PNG olarak tutulur. Klasörün toplam boyutu
+    disk_azami_boyut ile sınırlıdır; aşılınca en uzun süre kullanılmayan
+    dosyalar silinir. Yazma işleri iş havuzundan yapılabilir, bellekteki
+    LRU'lar ve boyut sayacı kilitle korunur.
+    """
+
+    UZANTILAR = (".json", ".png")
+
+    def __init__(self, klasor=None, kapasite=128, resim_azami_boyut=32 * 1024 * 1024,
+                 disk_azami_boyut=256 * 1024 * 1024):
+        super().__init__(klasor or varsayilan_grafik_klasoru(), disk_azami_boyut)
+        self._konumlar = LRUOnbellek(kapasite)
+        self._resimler = LRUOnbellek(azami_boyut=resim_azami_boyut, boyut=lambda resim: resim.nbytes)
+
+    @staticmethod
+    def anahtar(tur, sure, ayet, boyut, girdi):
+        veri = json.dumps([tur, sure, ayet, boyut, girdi], ensure_ascii=False, sort_keys=True)
+        return hashlib.sha1(veri.encode("utf-8")).hexdigest()
+
+    def _yol(self, anahtar, uzanti):
+        return os.path.join(self.klasor, anahtar[:2], anahtar + uzanti)
+
+    # -------------------- Düğüm konumları --------------------
+    def konumlar_getir(self, anahtar):
+        """{düğüm: (x, y)} döndürür, kayıt yoksa None"""
+        konumlar = self._konumlar.getir(anahtar)
+        if konumlar is not None:
+            return konumlar
+        yol = self._yol(anahtar, ".json")
+        if not self._kullanildi(yol):
+            return None
+        try:
+            with open(yol, "r", encoding="utf-8") as f:
+                konumlar = {dugum: np.array(xy) for dugum, xy in json.load(f)}
+        except (OSError, ValueError):
+            return None
+        self._konumlar.ekle(anahtar, konumlar)
+        return konumlar
+
+    def konumlar_kaydet(self, anahtar, konumlar):
+        def yaz(yol):
+            with open(yol, "w", encoding="utf-8") as f:
+                json.dump([[dugum, [float(x), float(y)]] for dugum, (x, y) in konumlar.items()],
+                          f, ensure_ascii=False)
+        self._konumlar.ekle(anahtar, konumlar)
+        self._eklendi(atomik_yaz(self._yol(anahtar, ".json"), yaz))
+
+    # -------------------- Görüntüler --------------------
+    def resim_getir(self, anahtar):
+        """RGB görüntüyü numpy dizisi olarak döndürür, kayıt yoksa None"""
+        resim = self._resimler.getir(anahtar)
+        if resim is not None:
+            return resim
+        yol = self._yol(anahtar, ".png")
+        if not self._kullanildi(yol):
+            return None
+        try:
+            from PIL import Image
+            with Image.open(yol) as img:
+                resim = np.asarray(img.convert("RGB"))
+        except Exception:
+            return None
+        self._resimler.ekle(anahtar, resim)
+        return resim
+
+    def resim_kaydet(self, anahtar, resim):
+        from PIL import Image
+        self._resimler.ekle(anahtar, resim)
+        self._eklendi(atomik_yaz(self._yol(anahtar, ".png"),
+                                 lambda yol: Image.fromarray(resim).save(yol, format="PNG")))
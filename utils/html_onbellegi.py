@@ -0,0 +1,14 @@
+from utils.lru_onbellek import LRUOnbellek
+
+HTML_ONBELLEK_KAPASITESI = 2000
+
+
+class HtmlOnbellegi(LRUOnbellek):
+    """Ayet HTML parçaları için boyutu sınırlı LRU önbellek.
+
+    Anahtarlar (görünüm, sure, ayet, meal, vurgu terimleri) demetleridir;
+    dolu olduğunda en uzun süre kullanılmayan parça atılır.
+    """
+
+    def __init__(self, kapasite=HTML_ONBELLEK_KAPASITESI):
+        super().__init__(kapasite=kapasite)
@@ -0,0 +1,65 @@
+import re
+from collections import Counter
+
+import numpy as np
+
+from utils.veri_isleyici import normalize_arabic
+
+_ARAPCA_KELIME = re.compile(r'<span[^>]*>([^<]+)</span>')
+
+
+class IstatistikMotoru:
+    """İstatistik sekmesinin sayılarını toplu işlemlerle hesaplayıp saklar.
+
+    Türkçe sayımlar meal başına, Arapça sayımlar (tüm meallerde aynı olan
+    Arapça metinden) bir kez hesaplanır. Metinler tek seferde birleştirilip
+    bölünür; sayımlar Counter ve numpy ile yapılır, ayet başına döngü yoktur.
+    """
+
+    def __init__(self):
+        self._turkce = {}   # meal -> Türkçe sonuçlar
+        self._arapca = None
+
+    def hesapla(self, meal, veriler):
+        """Meal için istatistik sözlüğünü döndürür; ikinci çağrıda önbellekten gelir"""
+        if not veriler:
+            return None
+        if meal not in self._turkce:
+            self._turkce[meal] = self._turkce_hesapla(veriler)
+        if self._arapca is None:
+            self._arapca = self._arapca_hesapla(veriler)
+        return {**self._turkce[meal], **self._arapca}
+
+    def temizle(self):
+        self._turkce.clear()
+        self._arapca = None
+
+    @staticmethod
+    def _turkce_hesapla(veriler):
+        sureler = Counter(item['sure'] for item in veriler)
+        kelimeler = " ".join(item.get('meal', '') for item in veriler).split()
+        # Kelime başı/sonu noktalama atılır, boş kalanlar sayılmaz
+        sikliklar = Counter(filter(None, (k.strip('.,!?;:') for k in " ".join(kelimeler).lower().split())))
+        return {
+            'sureler': sureler,
+            'toplam_ayet': len(veriler),
+            'toplam_kelime_turkce': len(kelimeler),
+            'benzersiz_turkce': len(sikliklar),
+            'en_sik_kelimeler': sikliklar.most_common(10),
+        }
+
+    @staticmethod
+    def _arapca_hesapla(veriler):
+        kelimeler = _ARAPCA_KELIME.findall("\n".join(item.get('arapca', '') for item in veriler))
+        # normalize_arabic karakter düzeyinde çalıştığı için tüm kelimeler tek çağrıda işlenir
+        normal = [k for k in normalize_arabic("\n".join(k.replace("\n", " ") for k in kelimeler)).split("\n") if k]
+
+        harfler = Counter("".join(normal))
+        harfler = Counter({h: n for h, n in harfler.items() if h.isalpha()})
+        uzunluklar = np.fromiter(map(len, normal), dtype=np.int32, count=len(normal))
+        return {
+            'toplam_kelime_arapca': len(kelimeler),
+            'benzersiz_arapca': len(set(normal)),
+            'en_sik_harfler': harfler.most_common(5),
+            'ortalama_kelime_uzunlugu': float(uzunluklar.mean()) if len(uzunluklar) else 0.0,
+        }
@@ -0,0 +1,134 @@
+import numpy as np
+
+AYET = "ayet"
+SURE = "sure"
+
+
+class KokBirliktelikMatrisi:
+    """Tüm korpus için seyrek kök × kök birlikte geçme matrisi (CSR dizileri).
+
+    pencere:
+        "ayet"  iki kökün birlikte geçtiği ayet sayısı
+        "sure"  iki kökün birlikte geçtiği sure sayısı
+        n (int) aynı surede aralarındaki uzaklık en fazla n-1 kelime (kökü
+                olmayan kelimeler dahil) olacak şekilde geçme sayısı
+
+    Matris simetriktir ve köşegeni boştur; satırlar indptr/indices/data
+    dizileriyle tutulur, bir kökün komşuları tek dilimle okunur.
+    """
+
+    def __init__(self, kelimeler, pencere=AYET):
+        self.pencere = pencere
+        # Kayan pencerede mesafe kökü olmayan kelimeler de sayılarak ölçülür;
+        # bu yüzden konumlar tüm kelimeler sıralanarak verilir
+        tum = sorted(kelimeler, key=lambda w: (w['sureNo'], w['ayetNo'], w['kelimeNo']))
+        sirali = [(i, w) for i, w in enumerate(tum) if (w.get('kok') or '').strip()]
+        self.kokler = sorted({w['kok'].strip() for _, w in sirali})
+        self.kok_no = {k: i for i, k in enumerate(self.kokler)}
+
+        kimlik = np.fromiter((self.kok_no[w['kok'].strip()] for _, w in sirali), dtype=np.int32, count=len(sirali))
+        konum = np.fromiter((i for i, _ in sirali), dtype=np.int64, count=len(sirali))
+        sure = np.fromiter((w['sureNo'] for _, w in sirali), dtype=np.int32, count=len(sirali))
+        ayet = np.fromiter((w['ayetNo'] for _, w in sirali), dtype=np.int32, count=len(sirali))
+
+        if pencere == AYET:
+            a, b = self._birim_ciftleri(kimlik, sure * 1000 + ayet)
+        elif pencere == SURE:
+            a, b = self._birim_ciftleri(kimlik, sure)
+        else:
+            a, b = self._kayan_ciftler(kimlik, konum, sure, int(pencere))
+        self._csr_olustur(a, b)
+
+    @staticmethod
+    def _birim_ciftleri(kimlik, birim):
+        """Her birimdeki (ayet/sure) farklı kökler arasında tüm çiftler"""
+        n = kimlik.max() + 1 if len(kimlik) else 1
+        # Birim içinde tekrar eden kökler bir kez sayılır
+        benzersiz = np.unique(birim.astype(np.int64) * n + kimlik)
+        birim, kimlik = benzersiz // n, (benzersiz % n).astype(np.int32)
+        sinirlar = np.flatnonzero(np.diff(birim)) + 1
+        parcalar_a, parcalar_b = [], []
+        for grup in np.split(kimlik, sinirlar):
+            if len(grup) < 2:
+                continue
+            i, j = np.triu_indices(len(grup), 1)
+            parcalar_a.append(grup[i])
+            parcalar_b.append(grup[j])
+        if not parcalar_a:
+            return np.empty(0, np.int32), np.empty(0, np.int32)
+        return np.concatenate(parcalar_a), np.concatenate(parcalar_b)
+
+    @staticmethod
+    def _kayan_ciftler(kimlik, konum, sure, n):
+        """Aynı surede konumları en fazla n-1 farklı (araya kökü olmayanlar dahil) kök çiftleri"""
+        # Kökü olmayan kelimeler dizide yer almadığından, konum farkı n-1'i aşmayan
+        # çiftler dizide de en fazla n-1 uzaktadır; fazlası maskeyle elenir
+        parcalar_a, parcalar_b = [], []
+        for d in range(1, max(2, n)):
+            a, b = kimlik[:-d], kimlik[d:]
+            maske = (sure[:-d] == sure[d:]) & (konum[d:] - konum[:-d] < max(2, n)) & (a != b)
+            parcalar_a.append(a[maske])
+            parcalar_b.append(b[maske])
+        return np.concatenate(parcalar_a), np.concatenate(parcalar_b)
+
+    def _csr_olustur(self, a, b):
+        n = len(self.kokler)
+        # Simetrik: her çift iki yönde de yazılır, aynı çiftler sayılarak birleştirilir
+        satir = np.concatenate([a, b]).astype(np.int64)
+        sutun = np.concatenate([b, a]).astype(np.int64)
+        kodlar, sayilar = np.unique(satir * n + sutun, return_counts=True)
+        satir, sutun = kodlar // n, kodlar % n
+        self.indptr = np.zeros(n + 1, dtype=np.int64)
+        np.add.at(self.indptr, satir + 1, 1)
+        np.cumsum(self.indptr, out=self.indptr)
+        self.indices = sutun.astype(np.int32)
+        self.data = sayilar.astype(np.int32)
+
+    # -------------------- Sorgular --------------------
+    def __len__(self):
+        return len(self.kokler)
+
+    def deger(self, k1, k2):
+        """İki kökün birlikte geçme sayısı"""
+        i, j = self.kok_no.get(k1), self.kok_no.get(k2)
+        if i is None or j is None:
+            return 0
+        bas, son = self.indptr[i], self.indptr[i + 1]
+        konum = bas + np.searchsorted(self.indices[bas:son], j)
+        return int(self.data[konum]) if konum < son and self.indices[konum] == j else 0
+
+    def komsular(self, kok, limit=20):
+        """Köke en sık eşlik eden kökleri (kök, sayı) olarak azalan sırayla döndürür"""
+        i = self.kok_no.get(kok)
+        if i is None:
+            return []
+        bas, son = self.indptr[i], self.indptr[i + 1]
+        sutunlar, sayilar = self.indices[bas:son], self.data[bas:son]
+        sira = np.argsort(-sayilar, kind="stable")[:limit]
+        return [(self.kokler[sutunlar[k]], int(sayilar[k])) for k in sira]
+
+    def secim_kenarlari(self, kokler, en_az=1):
+        """Seçili kökler arasındaki kenarları (k1, k2, sayı) olarak döndürür"""
+        numaralar = sorted({self.kok_no[k] for k in kokler if k in self.kok_no})
+        secili = np.array(numaralar, dtype=np.int32)
+        kenarlar = []
+        for i in numaralar:
+            bas, son = self.indptr[i], self.indptr[i + 1]
+            sutunlar, sayilar = self.indices[bas:son], self.data[bas:son]
+            maske = np.isin(sutunlar, secili) & (sutunlar > i) & (sayilar >= en_az)
+            kenarlar.extend((self.kokler[i], self.kokler[j], int(s))
+                            for j, s in zip(sutunlar[maske], sayilar[maske]))
+        return kenarlar
+
+    def kok_alt_agi(self, kok, limit=15):
+        """Kök ve en sık komşularından oluşan alt ağın (düğümler, kenarlar) çifti"""
+        if kok not in self.kok_no:
+            return [], []
+        dugumler = [kok] + [k for k, _ in self.komsular(kok, limit)]
+        return dugumler, self.secim_kenarlari(dugumler)
+
+    def scipy_matrisi(self):
+        """scipy kuruluysa aynı veriyi scipy.sparse.csr_matrix olarak döndürür"""
+        from scipy.sparse import csr_matrix
+        n = len(self.kokler)
+        return csr_matrix((self.data, self.indices, self.indptr), shape=(n, n))
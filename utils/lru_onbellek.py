@@ -0,0 +1,74 @@
+import threading
+from collections import OrderedDict
+
+
+class LRUOnbellek:
+    """Bellek içi, iş parçacığı güvenli LRU önbellek.
+
+    kapasite kayıt sayısını, azami_boyut ise boyut(deger) toplamını sınırlar
+    (ikisi de verilebilir). Sınır aşılınca en uzun süre kullanılmayan
+    kayıtlar atılır. Değer olarak None saklanmaz.
+    """
+
+    def __init__(self, kapasite=None, azami_boyut=None, boyut=None):
+        self.kapasite = kapasite
+        self.azami_boyut = azami_boyut
+        self._boyut = boyut or (lambda deger: 1)
+        self._kayitlar = OrderedDict()  # anahtar -> (değer, boyut)
+        self._toplam = 0
+        self._kilit = threading.Lock()
+        self.isabet = 0
+        self.iska = 0
+
+    def __len__(self):
+        return len(self._kayitlar)
+
+    def __contains__(self, anahtar):
+        return anahtar in self._kayitlar
+
+    @property
+    def toplam_boyut(self):
+        return self._toplam
+
+    def getir(self, anahtar, olustur=None):
+        """Kaydı döndürür; yoksa olustur() verilmişse üretip saklar, verilmemişse None"""
+        with self._kilit:
+            kayit = self._kayitlar.get(anahtar)
+            if kayit is not None:
+                self._kayitlar.move_to_end(anahtar)
+                self.isabet += 1
+                return kayit[0]
+            self.iska += 1
+        if olustur is None:
+            return None
+        deger = olustur()
+        self.ekle(anahtar, deger)
+        return deger
+
+    def ekle(self, anahtar, deger):
+        boyut = self._boyut(deger)
+        with self._kilit:
+            eski = self._kayitlar.pop(anahtar, None)
+            if eski is not None:
+                self._toplam -= eski[1]
+            self._kayitlar[anahtar] = (deger, boyut)
+            self._toplam += boyut
+            self._sinirla()
+
+    def _sinirla(self):
+        # En son eklenen kayıt tek başına sınırı aşsa da tutulur
+        while len(self._kayitlar) > 1 and (
+                (self.kapasite is not None and len(self._kayitlar) > self.kapasite)
+                or (self.azami_boyut is not None and self._toplam > self.azami_boyut)):
+            _, (_, boyut) = self._kayitlar.popitem(last=False)
+            self._toplam -= boyut
+
+    def kapasite_ayarla(self, kapasite):
+        with self._kilit:
+            self.kapasite = kapasite
+            self._sinirla()
+
+    def temizle(self):
+        with self._kilit:
+            self._kayitlar.clear()
+            self._toplam = 0
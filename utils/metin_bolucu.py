@@ -0,0 +1,78 @@
+import re
+
+# Cümle sonu: Latin noktalama, Arapça soru işareti ve ayet içi durak işaretleri
+_CUMLE_SONU = re.compile(r'(?<=[.!?;…؟۔])\s+|(?<=[ۖ-ۜ])\s+')
+# Arapça metin kelime başına <span kok=...>kelime</span> biçimindedir
+_ARAPCA_KELIME = re.compile(r'<span[^>]*>([^<]+)</span>')
+_ETIKET = re.compile(r'<[^>]+>')
+# Cümle uzunsa virgül, iki nokta ve tire gibi yan cümle sınırlarından bölünür
+_YAN_CUMLE = re.compile(r'(?<=[,:،])\s+|\s+(?=[-–—]\s)')
+
+
+def _kelimelerle_bol(parca, azami):
+    """Sınır bulunamayan uzun parçayı kelime aralarından böler"""
+    satirlar, satir = [], ""
+    for kelime in parca.split():
+        if satir and len(satir) + 1 + len(kelime) > azami:
+            satirlar.append(satir)
+            satir = kelime
+        else:
+            satir = f"{satir} {kelime}" if satir else kelime
+    if satir:
+        satirlar.append(satir)
+    return satirlar
+
+
+def _birlestir(parcalar, asgari, azami):
+    """Çok kısa parçaları komşusuyla birleştirir; sentez isteği sayısını azaltır"""
+    sonuc = []
+    for parca in parcalar:
+        if sonuc and (len(sonuc[-1]) < asgari or len(parca) < asgari) \
+                and len(sonuc[-1]) + 1 + len(parca) <= azami:
+            sonuc[-1] = f"{sonuc[-1]} {parca}"
+        else:
+            sonuc.append(parca)
+    return sonuc
+
+
+def cumlelere_bol(metin, azami=220, asgari=40):
+    """Uzun metni seslendirme için cümle ve yan cümle sınırlarından parçalara ayırır.
+
+    Her parça en fazla `azami` karakterdir (tek kelime daha uzunsa hariç);
+    `asgari` karakterden kısa parçalar komşusuyla birleştirilir. Kısa metin
+    tek parça olarak döner, böylece önbellek anahtarı değişmez.
+    """
+    if len(metin.strip()) <= azami:
+        return [metin] if metin.strip() else []
+    metin = " ".join(metin.split())
+
+    parcalar = []
+    for cumle in filter(None, _CUMLE_SONU.split(metin)):
+        if len(cumle) <= azami:
+            parcalar.append(cumle)
+            continue
+        for yan in filter(None, _YAN_CUMLE.split(cumle)):
+            if len(yan) <= azami:
+                parcalar.append(yan)
+            else:
+                parcalar.extend(_kelimelerle_bol(yan, azami))
+    return _birlestir([p.strip() for p in parcalar if p.strip()], asgari, azami)
+
+
+def seslendirilecek_metin(metin, dil):
+    """Seslendirilecek düz metni döndürür; Arapça için yalnızca span içindeki kelimeler"""
+    if dil == "ar":
+        kelimeler = _ARAPCA_KELIME.findall(metin) or _ETIKET.sub(" ", metin).split()
+        return " ".join(" ".join(kelimeler).split())
+    return metin
+
+
+def ses_parcalari(metin, dil):
+    """Metnin önbellek anahtarı olan ses parçaları; uygulamalar ve toplu üretim aynı kuralı kullanır.
+
+    Meal cümle parçalarına bölünür; Arapça ayet tek parça olarak seslendirilir.
+    """
+    metin = seslendirilecek_metin(metin, dil)
+    if dil == "ar":
+        return [metin] if metin else []
+    return cumlelere_bol(metin)
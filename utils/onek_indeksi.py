@@ -0,0 +1,46 @@
+from bisect import bisect_left
+
+
+class OnekIndeksi:
+    """Normalize edilmiş anahtarlar üzerinde sıralı dizi tutan önek indeksi.
+
+    Önek sorguları her seferinde tüm kelime listesini dolaşmak yerine
+    iki bisect ile [bas, son) aralığını bulur.
+    """
+
+    def __init__(self, kelimeler, anahtar=None):
+        self.anahtar = anahtar or (lambda k: k)
+        # sorted kararlı olduğu için aynı anahtarlı kelimeler giriş sırasını korur
+        ciftler = sorted(((self.anahtar(k), k) for k in kelimeler), key=lambda c: c[0])
+        self.anahtarlar = [a for a, _ in ciftler]
+        self.kelimeler = [k for _, k in ciftler]
+
+    def __len__(self):
+        return len(self.kelimeler)
+
+    def aralik(self, onek):
+        """Öneke uyan kelimelerin [bas, son) indeks aralığını döndürür"""
+        onek = self.anahtar(onek)
+        if not onek:
+            return 0, len(self.anahtarlar)
+        bas = bisect_left(self.anahtarlar, onek)
+        son_harf = ord(onek[-1])
+        if son_harf >= 0x10FFFF:
+            son = len(self.anahtarlar)
+        else:
+            # Önekten hemen sonra gelen en küçük dizge: son harfi bir artır
+            ust_sinir = onek[:-1] + chr(son_harf + 1)
+            son = bisect_left(self.anahtarlar, ust_sinir, bas)
+        return bas, son
+
+    def onek_ara(self, onek, limit=None):
+        """Öneke uyan kelimeleri sıralı olarak döndürür"""
+        bas, son = self.aralik(onek)
+        if limit is not None:
+            son = min(son, bas + limit)
+        return self.kelimeler[bas:son]
+
+    def say(self, onek):
+        """Öneke uyan kelime sayısını döndürür"""
+        bas, son = self.aralik(onek)
+        return son - bas
@@ -0,0 +1,210 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as GelecekZamanAsimi
+from itertools import islice
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from utils.metin_bolucu import ses_parcalari
+from utils.ses_onbellegi import SesOnbellegi
+from utils.tts_motorlari import motor_olustur, uygun_motor_olustur
+
+
+class SesMotoru(QThread):
+    """Metinleri arka planda seslendirip çalan ses motoru.
+
+    Sentez (seçili TTS motoru) bir iş havuzunda, oynatma bu iş parçacığında
+    yapılır; arayüz yalnızca sinyalleri dinler. Sentezlenen sesler kalıcı
+    önbellekte tutulur. Bir öğe çalarken kuyruktaki sonraki `onceden` öğe
+    arka planda sentezlenir, böylece çalma listesinde boşluk oluşmaz.
+    Uzun metinler cümle parçalarına bölünür; ilk parça hazır olur olmaz
+    çalmaya başlanır, sonraki parçalar bu sırada paralel sentezlenir.
+    durdur() çalanı keser ve kuyruğu boşaltır. İş parçacığı sentezi ve
+    çalmayı kısa aralıklarla bekler, bu yüzden durdur()/kapat() en geç
+    BEKLEME_ARALIGI saniye içinde etkili olur.
+    """
+
+    BEKLEME_ARALIGI = 0.05
+
+    simdi_caliyor = pyqtSignal(str, object)  # çalmaya başlayan metin ve kimliği
+    bitti = pyqtSignal()                     # kuyruk boşaldı, çalma bitti
+    kuyruk_degisti = pyqtSignal(int)         # bekleyen istek sayısı
+    hata = pyqtSignal(str)
+
+    def __init__(self, parent=None, onbellek=None, tts=None, onceden=3, sentez_isci=3):
+        super().__init__(parent)
+        self.onbellek = onbellek or SesOnbellegi()
+        self.tts = tts or uygun_motor_olustur()
+        self.onceden = onceden
+        self._havuz = ThreadPoolExecutor(max_workers=sentez_isci)
+        self._bekleyen = deque()   # (metin, dil, kimlik)
+        self._gelecekler = {}      # (motor, ses, metin, dil) -> Future
+        self._kosul = threading.Condition()
+        self._durdur = False
+        self._kapat = False
+
+    # -------------------- Arayüz tarafı --------------------
+    def seslendir(self, metin, dil="tr", kuyruga_ekle=False, kimlik=None):
+        """Metni okuma kuyruğuna ekler; kuyruga_ekle False ise önce çalanı keser"""
+        if not metin or not metin.strip():
+            return
+        self._ekle(self._parcala(metin, dil, kimlik), kuyruga_ekle)
+
+    def calma_listesi(self, ogeler, dil="tr"):
+        """(metin, kimlik) çiftlerini sırayla çalar; sonraki öğeler önceden sentezlenir"""
+        self._ekle([oge for metin, kimlik in ogeler if metin and metin.strip()
+                    for oge in self._parcala(metin, dil, kimlik)], False)
+
+    @staticmethod
+    def _parcala(metin, dil, kimlik):
+        # Parçalar aynı kimliği taşır; her biri ayrı önbellek kaydıdır
+        return [(parca, dil, kimlik) for parca in ses_parcalari(metin, dil)]
+
+    def _ekle(self, ogeler, kuyruga_ekle):
+        if not kuyruga_ekle:
+            self.durdur()
+        with self._kosul:
+            self._bekleyen.extend(ogeler)
+            adet = len(self._bekleyen)
+            self._kosul.notify()
+        self.kuyruk_degisti.emit(adet)
+        if not self.isRunning():
+            self.start()
+
+    def motor_degistir(self, ad, ses=""):
+        """Sentez motorunu çalışma sırasında değiştirir; sonraki istekler yeni motoru kullanır"""
+        self.tts = motor_olustur(ad, ses)
+
+    def durdur(self):
+        """Çalan sesi keser, bekleyen istekleri ve önceden başlatılan sentezleri siler"""
+        with self._kosul:
+            self._bekleyen.clear()
+            for gelecek in self._gelecekler.values():
+                gelecek.cancel()
+            self._gelecekler.clear()
+            self._durdur = True
+        self.kuyruk_degisti.emit(0)
+
+    def kapat(self):
+        """Uygulama kapanırken iş parçacığını ve sentez havuzunu sonlandırır.
+
+        İş parçacığı bitene kadar beklenir; pencere yok edilirken QThread
+        çalışıyor olursa Qt süreci sonlandırır.
+        """
+        self.durdur()
+        with self._kosul:
+            self._kapat = True
+            self._kosul.notify()
+        self._havuz.shutdown(wait=False, cancel_futures=True)
+        while not self.wait(1000):
+            pass
+
+    # -------------------- İş parçacığı tarafı --------------------
+    def run(self):
+        while True:
+            with self._kosul:
+                while not self._bekleyen and not self._kapat:
+                    self._kosul.wait()
+                if self._kapat:
+                    break
+                metin, dil, kimlik = self._bekleyen.popleft()
+                kalan = len(self._bekleyen)
+                self._durdur = False
+                gelecek = self._sentez_baslat(metin, dil, kaldir=True)
+                # Bu öğe çalarken sonrakiler havuzda sentezlenir
+                for s_metin, s_dil, _ in islice(self._bekleyen, self.onceden):
+                    self._sentez_baslat(s_metin, s_dil)
+            self.kuyruk_degisti.emit(kalan)
+
+            try:
+                yol = self._sonucu_bekle(gelecek)
+                if yol and not self._durdur:
+                    self.simdi_caliyor.emit(metin, kimlik)
+                    self._cal(yol)
+            except Exception as e:
+                if not self._durdur:
+                    self.hata.emit(f"Sesli okuma hatası: {str(e)}")
+            with self._kosul:
+                bos = not self._bekleyen
+            if bos:
+                self.bitti.emit()
+
+    def _sonucu_bekle(self, gelecek):
+        # Süren sentez _gelecekler'den çıkarıldığı için durdur() onu iptal edemez;
+        # bekleme kısa aralıklarla yapılır ve durdurulunca None döner
+        while not (self._durdur or self._kapat):
+            try:
+                return gelecek.result(timeout=self.BEKLEME_ARALIGI)
+            except GelecekZamanAsimi:
+                continue
+        gelecek.cancel()
+        return None
+
+    def _sentez_baslat(self, metin, dil, kaldir=False):
+        # _kosul kilidi tutulurken çağrılır
+        tts = self.tts
+        anahtar = (tts.ad, tts.ses, metin, dil)
+        gelecek = self._gelecekler.pop(anahtar, None) if kaldir else self._gelecekler.get(anahtar)
+        if gelecek is None or gelecek.cancelled():
+            gelecek = self._havuz.submit(self._sentezle, tts, metin, dil)
+            if not kaldir:
+                self._gelecekler[anahtar] = gelecek
+        return gelecek
+
+    def _sentezle(self, tts, metin, dil):
+        # Önbellekte yoksa seçili motorla oluşturulur, varsa doğrudan çalınır
+        return self.onbellek.getir_veya_olustur(
+            metin, dil, tts.ad, lambda hedef: tts.sentezle(metin, dil, hedef),
+            ses=tts.ses, uzanti=tts.uzanti)
+
+    def _cal(self, yol):
+        # pygame ile ses dosyasını oynat (daha güvenilir)
+        try:
+            import pygame
+
+            if not pygame.mixer.get_init():
+                pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
+            pygame.mixer.music.load(yol)
+            pygame.mixer.music.set_volume(0.8)  # Ses seviyesini %80'e ayarla
+            pygame.mixer.music.play()
+
+            # Oynatma bitene ya da durdurulana kadar bu iş parçacığında bekle
+            while pygame.mixer.music.get_busy() and not self._durdur and not self._kapat:
+                time.sleep(self.BEKLEME_ARALIGI)
+
+            pygame.mixer.music.stop()
+            pygame.mixer.music.unload()  # Belleği temizle
+        except Exception as pygame_error:
+            # pygame başarısız olursa playsound'u dene; playsound kesilemediği için
+            # ayrı (daemon) iş parçacığında çalınır, bu iş parçacığı durdurulabilir kalır
+            try:
+                self._playsound_cal(yol)
+            except Exception as playsound_error:
+                error_msg = "Ses oynatma başarısız oldu:\n\n"
+                error_msg += f"pygame hatası: {str(pygame_error)}\n\n"
+                error_msg += f"playsound hatası: {str(playsound_error)}\n\n"
+                error_msg += "Öneriler:\n"
+                error_msg += "1. Ses sürücülerinizi kontrol edin\n"
+                error_msg += "2. Başka uygulamalarda ses çalışıyor mu?\n"
+                error_msg += "3. Sistem ses ayarlarını kontrol edin\n"
+                error_msg += "4. Gerekirse bilgisayarı yeniden başlatın"
+                self.hata.emit(error_msg)
+
+    def _playsound_cal(self, yol):
+        import playsound
+
+        hatalar = []
+
+        def cal():
+            try:
+                playsound.playsound(yol, block=True)
+            except Exception as e:
+                hatalar.append(e)
+
+        calici = threading.Thread(target=cal, daemon=True)
+        calici.start()
+        while calici.is_alive() and not self._durdur and not self._kapat:
+            calici.join(self.BEKLEME_ARALIGI)
+        if hatalar:
+            raise hatalar[0]
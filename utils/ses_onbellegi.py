@@ -0,0 +1,73 @@
+import hashlib
+import json
+import os
+
+from utils.disk_onbellegi import DiskOnbellegi
+from utils.dosya_islemleri import atomik_yaz
+
+# Uygulamalar ve toplu üretim aynı sınırı kullanır; toplu üretimde verilen
+# sınır önbellek klasörüne yazılır ve sonraki açılışlarda oradan okunur
+VARSAYILAN_AZAMI_BOYUT = 2048 * 1024 * 1024
+SINIR_DOSYASI = "sinir.json"
+SES_UZANTILARI = (".mp3", ".wav")
+
+
+def varsayilan_onbellek_klasoru():
+    """Kullanıcı dizininde kalıcı ses önbelleği klasörünü döndürür"""
+    return os.path.join(os.path.expanduser("~"), ".kuran_veri_analizi", "ses_onbellegi")
+
+
+class SesOnbellegi(DiskOnbellegi):
+    """(metin, dil, motor, ses) özetiyle adreslenen kalıcı ses dosyası önbelleği.
+
+    Her kayıt özetin ilk iki harfiyle açılan alt klasörde tutulur. Dosyalar
+    geçici adla yazılıp os.replace ile yerine konur; toplam boyut sınırı
+    aşılınca en uzun süre kullanılmayan (mtime) dosyalar silinir. Boyut
+    sınırı verilmezse klasördeki sinir.json'dan, o da yoksa varsayılandan
+    alınır. Boyut hesabı ve silme yalnızca ses dosyalarını kapsar.
+    """
+
+    UZANTILAR = SES_UZANTILARI
+
+    def __init__(self, klasor=None, azami_boyut=None):
+        super().__init__(klasor or varsayilan_onbellek_klasoru(), azami_boyut)
+        self.azami_boyut = azami_boyut or self._kayitli_sinir() or VARSAYILAN_AZAMI_BOYUT
+
+    def _kayitli_sinir(self):
+        try:
+            with open(os.path.join(self.klasor, SINIR_DOSYASI), "r", encoding="utf-8") as f:
+                return int(json.load(f)["azami_boyut"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def sinir_kaydet(self, azami_boyut):
+        """Boyut sınırını değiştirip klasöre yazar; aynı klasörü kullanan uygulamalar da bu sınırı kullanır"""
+        def yaz(yol):
+            with open(yol, "w", encoding="utf-8") as f:
+                json.dump({"azami_boyut": int(azami_boyut)}, f)
+        atomik_yaz(os.path.join(self.klasor, SINIR_DOSYASI), yaz)
+        with self._kilit:
+            self.azami_boyut = int(azami_boyut)
+
+    @staticmethod
+    def anahtar(metin, dil, motor, ses=""):
+        veri = json.dumps([metin, dil, motor, ses or ""], ensure_ascii=False)
+        return hashlib.sha256(veri.encode("utf-8")).hexdigest()
+
+    def yol(self, anahtar, uzanti=".mp3"):
+        return os.path.join(self.klasor, anahtar[:2], anahtar + uzanti)
+
+    def getir(self, metin, dil, motor, ses="", uzanti=".mp3"):
+        """Kayıt varsa yolunu döndürür ve kullanım zamanını günceller, yoksa None"""
+        yol = self.yol(self.anahtar(metin, dil, motor, ses), uzanti)
+        return yol if self._kullanildi(yol) else None
+
+    def getir_veya_olustur(self, metin, dil, motor, olustur, ses="", uzanti=".mp3"):
+        """Kayıt yoksa olustur(hedef_yol) ile sentezletip önbelleğe yazar"""
+        yol = self.getir(metin, dil, motor, ses, uzanti)
+        if yol:
+            return yol
+
+        yol = atomik_yaz(self.yol(self.anahtar(metin, dil, motor, ses), uzanti), olustur)
+        self._eklendi(yol)
+        return yol
@@ -0,0 +1,56 @@
+from array import array
+from bisect import bisect_right
+
+_AYRAC = "\x00"
+
+
+class SonekDizisi:
+    """Kelime dağarcığı üzerinde sonek dizisi (suffix array).
+
+    Anahtarlar ayraçla birleştirilip tek metin yapılır; dizide yalnızca
+    sonek başlangıç konumları tutulur. Sorguyu içeren anahtarlar, sorguyla
+    başlayan soneklerin ikili aramayla bulunan bitişik aralığıdır:
+    O(|q| log n) + eşleşme sayısı.
+    """
+
+    def __init__(self, anahtarlar):
+        self.anahtarlar = list(anahtarlar)
+        self.metin = _AYRAC.join(self.anahtarlar) + _AYRAC
+        self.baslangiclar = array("i")  # her anahtarın metindeki başlangıcı
+        konum = 0
+        for anahtar in self.anahtarlar:
+            self.baslangiclar.append(konum)
+            konum += len(anahtar) + 1
+
+        # Sonekler ayraçta kesilerek sıralanır; geçici dizeler sıralamadan sonra atılır
+        metin = self.metin
+        konumlar = [i for i, harf in enumerate(metin) if harf != _AYRAC]
+        konumlar.sort(key=lambda i: metin[i:metin.index(_AYRAC, i)])
+        self.sonekler = array("i", konumlar)
+
+    def __len__(self):
+        return len(self.sonekler)
+
+    def _alt_sinir(self, sorgu, ust=False):
+        # Konumlar üzerinde ikili arama; yalnızca |q| karakter karşılaştırılır
+        m = len(sorgu)
+        bas, son = 0, len(self.sonekler)
+        while bas < son:
+            orta = (bas + son) // 2
+            parca = self.metin[self.sonekler[orta]:self.sonekler[orta] + m]
+            if parca < sorgu or (ust and parca == sorgu):
+                bas = orta + 1
+            else:
+                son = orta
+        return bas
+
+    def icerenler(self, sorgu):
+        """Sorguyu alt dize olarak içeren anahtarları dağarcık sırasıyla döndürür"""
+        if not sorgu:
+            return list(self.anahtarlar)
+        if _AYRAC in sorgu:
+            return []
+        bas = self._alt_sinir(sorgu)
+        son = self._alt_sinir(sorgu, ust=True)
+        sahipler = {bisect_right(self.baslangiclar, konum) - 1 for konum in self.sonekler[bas:son]}
+        return [self.anahtarlar[i] for i in sorted(sahipler)]
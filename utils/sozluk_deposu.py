@@ -0,0 +1,177 @@
+import csv
+import json
+import os
+import sqlite3
+
+from utils.lru_onbellek import LRUOnbellek
+
+ALANLAR = ("kelime", "telaffuz", "koken", "anlam", "ornek")
+
+_GETIR = "SELECT kelime, telaffuz, koken, anlam, ornek FROM entries WHERE kelime = ?"
+_KAYDET = """
+    INSERT INTO entries(kelime, telaffuz, koken, anlam, ornek) VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(kelime) DO UPDATE SET
+        telaffuz = excluded.telaffuz, koken = excluded.koken,
+        anlam = excluded.anlam, ornek = excluded.ornek
+"""
+_BOS = object()  # sözlükte olmayan kelimeler de önbelleğe alınır
+
+# entries tablosunu izleyen tam metin dizini; tetikleyiciler eşzamanlı tutar
+_FTS_SEMA = """
+    CREATE VIRTUAL TABLE IF NOT EXISTS entries_fts USING fts5(
+        kelime, anlam, koken, ornek,
+        content='entries', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    );
+    CREATE TRIGGER IF NOT EXISTS entries_fts_ekle AFTER INSERT ON entries BEGIN
+        INSERT INTO entries_fts(rowid, kelime, anlam, koken, ornek)
+        VALUES (new.id, new.kelime, new.anlam, new.koken, new.ornek);
+    END;
+    CREATE TRIGGER IF NOT EXISTS entries_fts_sil AFTER DELETE ON entries BEGIN
+        INSERT INTO entries_fts(entries_fts, rowid, kelime, anlam, koken, ornek)
+        VALUES ('delete', old.id, old.kelime, old.anlam, old.koken, old.ornek);
+    END;
+    CREATE TRIGGER IF NOT EXISTS entries_fts_guncelle AFTER UPDATE ON entries BEGIN
+        INSERT INTO entries_fts(entries_fts, rowid, kelime, anlam, koken, ornek)
+        VALUES ('delete', old.id, old.kelime, old.anlam, old.koken, old.ornek);
+        INSERT INTO entries_fts(rowid, kelime, anlam, koken, ornek)
+        VALUES (new.id, new.kelime, new.anlam, new.koken, new.ornek);
+    END;
+"""
+# Sütun ağırlıkları: kelime, anlam, koken, ornek
+_FTS_ARA = """
+    SELECT e.kelime, e.telaffuz, e.koken, e.anlam, e.ornek,
+           snippet(entries_fts, 1, '<b>', '</b>', '…', 12)
+    FROM entries_fts JOIN entries e ON e.id = entries_fts.rowid
+    WHERE entries_fts MATCH ?
+    ORDER BY bm25(entries_fts, 10.0, 4.0, 2.0, 1.0)
+    LIMIT ?
+"""
+
+
+def _satir(kayit):
+    """Kaydı ALANLAR sırasıyla metin demetine çevirir; sözlük olmayan kayıtlar için None"""
+    if not isinstance(kayit, dict):
+        return None
+    # JSON'daki sayı vb. değerler metne çevrilir, eksik/None alanlar boş kalır
+    return tuple("" if kayit.get(alan) is None else str(kayit.get(alan)).strip() for alan in ALANLAR)
+
+
+class SozlukDeposu:
+    """sozluk_veritabani.db için kalıcı bağlantı, sık kelimeler için LRU önbellek.
+
+    Bağlantı WAL kipinde açılır; sorgular sabit SQL metinleriyle çalıştırıldığı
+    için sqlite3 modülünün hazır ifade (prepared statement) önbelleğinden
+    yararlanır. Toplu içe/dışa aktarma tek işlemde (transaction) yapılır.
+    SQLite FTS5 destekliyorsa kelime, anlam, köken ve örnek alanları tam
+    metin dizininde tutulur ve ara() sonuçları bm25 ile sıralanır.
+    """
+
+    def __init__(self, yol="sozluk_veritabani.db", kapasite=1024):
+        self.yol = yol
+        self._onbellek = LRUOnbellek(kapasite)
+        self.baglanti = sqlite3.connect(yol, cached_statements=256)
+        self.baglanti.execute("PRAGMA journal_mode=WAL")
+        self.baglanti.execute("PRAGMA synchronous=NORMAL")
+        self.baglanti.execute("PRAGMA temp_store=MEMORY")
+        with self.baglanti:
+            self.baglanti.execute("""
+                CREATE TABLE IF NOT EXISTS entries(
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    kelime  TEXT UNIQUE,
+                    telaffuz TEXT,
+                    koken    TEXT,
+                    anlam    TEXT,
+                    ornek    TEXT
+                )
+            """)
+        self.fts = self._fts_hazirla()
+
+    def _fts_hazirla(self):
+        """FTS5 dizinini ve tetikleyicileri kurar; ilk kurulumda mevcut kayıtları dizinler"""
+        try:
+            with self.baglanti:
+                self.baglanti.executescript(_FTS_SEMA)
+                if self.baglanti.execute("PRAGMA user_version").fetchone()[0] < 1:
+                    self.baglanti.execute("INSERT INTO entries_fts(entries_fts) VALUES ('rebuild')")
+                    self.baglanti.execute("PRAGMA user_version = 1")
+            return True
+        except sqlite3.OperationalError:
+            # FTS5 olmadan derlenmiş SQLite: ara() LIKE ile çalışır
+            return False
+
+    # -------------------- Tekil işlemler --------------------
+    def getir(self, kelime):
+        """Kelimenin kaydını sözlük olarak döndürür, yoksa None"""
+        kayit = self._onbellek.getir(kelime, lambda: self._veritabanindan(kelime))
+        return None if kayit is _BOS else kayit
+
+    def _veritabanindan(self, kelime):
+        satir = self.baglanti.execute(_GETIR, (kelime,)).fetchone()
+        return dict(zip(ALANLAR, satir)) if satir else _BOS
+
+    def kaydet(self, kelime, telaffuz="", koken="", anlam="", ornek=""):
+        """Kaydı ekler ya da aynı kelimenin kaydını günceller"""
+        with self.baglanti:
+            self.baglanti.execute(_KAYDET, (kelime, telaffuz, koken, anlam, ornek))
+        self._onbellek.ekle(kelime, dict(zip(ALANLAR, (kelime, telaffuz, koken, anlam, ornek))))
+
+    def ara(self, sorgu, limit=50):
+        """Kelime ve anlam metinlerinde arar; en ilgili kayıtlar önce gelir.
+
+        Her kayıt sözlüğüne eşleşen anlam parçasını içeren 'ozet' eklenir.
+        """
+        terimler = [t.replace('"', '') for t in sorgu.split()]
+        terimler = [t for t in terimler if t]
+        if not terimler:
+            return []
+        if self.fts:
+            # Her terim önek olarak aranır: "merhamet*" AND "allah*"
+            ifade = " ".join(f'"{t}"*' for t in terimler)
+            satirlar = self.baglanti.execute(_FTS_ARA, (ifade, limit)).fetchall()
+        else:
+            kosul = " AND ".join(["(kelime LIKE ? OR anlam LIKE ? OR koken LIKE ? OR ornek LIKE ?)"] * len(terimler))
+            parametreler = [f"%{t}%" for t in terimler for _ in range(4)]
+            satirlar = self.baglanti.execute(
+                f"SELECT kelime, telaffuz, koken, anlam, ornek, anlam FROM entries "
+                f"WHERE {kosul} ORDER BY kelime LIMIT ?", (*parametreler, limit)).fetchall()
+        return [dict(zip(ALANLAR + ("ozet",), satir)) for satir in satirlar]
+
+    # -------------------- Toplu işlemler --------------------
+    def toplu_kaydet(self, kayitlar):
+        """Sözlük kayıtlarını tek işlemde ekler/günceller; yazılan kayıt sayısını döndürür"""
+        satirlar = [satir for satir in map(_satir, kayitlar) if satir and satir[0]]
+        with self.baglanti:
+            self.baglanti.executemany(_KAYDET, satirlar)
+        self._onbellek.temizle()
+        return len(satirlar)
+
+    def ice_aktar(self, dosya_yolu):
+        """CSV (başlık satırlı) veya JSON (kayıt listesi) dosyasını içe aktarır"""
+        if os.path.splitext(dosya_yolu)[1].lower() == ".json":
+            with open(dosya_yolu, "r", encoding="utf-8") as f:
+                kayitlar = json.load(f)
+            if not isinstance(kayitlar, list):
+                raise ValueError("JSON dosyası kayıt listesi içermeli: "
+                                 '[{"kelime": ..., "anlam": ...}, ...]')
+            return self.toplu_kaydet(kayitlar)
+        with open(dosya_yolu, "r", encoding="utf-8-sig", newline="") as f:
+            return self.toplu_kaydet(csv.DictReader(f))
+
+    def disa_aktar(self, dosya_yolu):
+        """Tüm kayıtları uzantıya göre CSV veya JSON olarak yazar"""
+        imlec = self.baglanti.execute(
+            "SELECT kelime, telaffuz, koken, anlam, ornek FROM entries ORDER BY kelime")
+        kayitlar = [dict(zip(ALANLAR, satir)) for satir in imlec]
+        if os.path.splitext(dosya_yolu)[1].lower() == ".json":
+            with open(dosya_yolu, "w", encoding="utf-8") as f:
+                json.dump(kayitlar, f, ensure_ascii=False, indent=2)
+        else:
+            with open(dosya_yolu, "w", encoding="utf-8-sig", newline="") as f:
+                yazici = csv.DictWriter(f, fieldnames=ALANLAR)
+                yazici.writeheader()
+                yazici.writerows(kayitlar)
+        return len(kayitlar)
+
+    def kapat(self):
+        self.baglanti.close()
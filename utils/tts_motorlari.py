@@ -0,0 +1,157 @@
+import os
+import shutil
+import subprocess
+import threading
+import wave
+
+
+class TTSMotoru:
+    """Metni ses dosyasına dönüştüren sentez motorlarının ortak arayüzü.
+
+    Alt sınıflar ad, uzanti ve sentezle() tanımlar; önbellek anahtarında
+    motor adı ile ses (voice) kullanılır.
+    """
+
+    ad = ""
+    etiket = ""
+    uzanti = ".mp3"
+    cevrimdisi = False
+
+    def __init__(self, ses=""):
+        self.ses = ses
+
+    def kullanilabilir(self):
+        return True
+
+    def sentezle(self, metin, dil, hedef_yol):
+        raise NotImplementedError
+
+
+class GTTSMotoru(TTSMotoru):
+    """Google TTS (internet gerekir)"""
+
+    ad = "gtts"
+    etiket = "Google TTS (çevrimiçi)"
+    uzanti = ".mp3"
+
+    def kullanilabilir(self):
+        try:
+            import gtts  # noqa: F401
+            return True
+        except ImportError:
+            return False
+
+    def sentezle(self, metin, dil, hedef_yol):
+        from gtts import gTTS
+        gTTS(text=metin, lang=dil).save(hedef_yol)
+
+
+class EspeakMotoru(TTSMotoru):
+    """Yerel espeak-ng / espeak komutu ile çevrimdışı sentez"""
+
+    ad = "espeak-ng"
+    etiket = "eSpeak NG (çevrimdışı)"
+    uzanti = ".wav"
+    cevrimdisi = True
+
+    def _komut(self):
+        return shutil.which("espeak-ng") or shutil.which("espeak")
+
+    def kullanilabilir(self):
+        return self._komut() is not None
+
+    def sentezle(self, metin, dil, hedef_yol):
+        komut = self._komut()
+        if not komut:
+            raise RuntimeError("espeak-ng bulunamadı")
+        subprocess.run([komut, "-v", self.ses or dil, "-w", hedef_yol, metin],
+                       check=True, capture_output=True)
+
+
+class Pyttsx3Motoru(TTSMotoru):
+    """İşletim sisteminin ses motorunu (SAPI5, NSSpeech, espeak) kullanan pyttsx3"""
+
+    ad = "pyttsx3"
+    etiket = "Sistem sesi (pyttsx3, çevrimdışı)"
+    uzanti = ".wav"
+    cevrimdisi = True
+
+    # pyttsx3 motoru iş parçacığı güvenli değil, çağrılar sıraya alınır
+    _kilit = threading.Lock()
+
+    def kullanilabilir(self):
+        try:
+            import pyttsx3  # noqa: F401
+            return True
+        except ImportError:
+            return False
+
+    def sentezle(self, metin, dil, hedef_yol):
+        import pyttsx3
+        with self._kilit:
+            motor = pyttsx3.init()
+            ses = self.ses or self._dile_uygun_ses(motor, dil)
+            if ses:
+                motor.setProperty("voice", ses)
+            motor.save_to_file(metin, hedef_yol)
+            motor.runAndWait()
+            motor.stop()
+
+    @staticmethod
+    def _dile_uygun_ses(motor, dil):
+        for ses in motor.getProperty("voices"):
+            diller = [d.decode("utf-8", "ignore") if isinstance(d, bytes) else str(d)
+                      for d in (getattr(ses, "languages", None) or [])]
+            if any(d.lower().lstrip("\x05").startswith(dil) for d in diller) or dil in ses.id.lower():
+                return ses.id
+        return None
+
+
+class SessizMotor(TTSMotoru):
+    """Ağ ve ses kütüphanesi gerektirmeyen yerel yedek motor.
+
+    Metin uzunluğuyla orantılı sessiz bir WAV üretir; çevrimdışı denemeler
+    ve sentez süresinden bağımsız ölçümler için kullanılır.
+    """
+
+    ad = "sessiz"
+    etiket = "Sessiz yerel motor (test)"
+    uzanti = ".wav"
+    cevrimdisi = True
+
+    ornekleme = 16000
+    harf_suresi = 0.06  # saniye
+
+    def sentezle(self, metin, dil, hedef_yol):
+        sure = min(30.0, max(0.2, len(metin) * self.harf_suresi))
+        with wave.open(hedef_yol, "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(self.ornekleme)
+            wav.writeframes(b"\x00\x00" * int(sure * self.ornekleme))
+
+
+MOTORLAR = {m.ad: m for m in (GTTSMotoru, EspeakMotoru, Pyttsx3Motoru, SessizMotor)}
+
+
+def motor_olustur(ad=None, ses=""):
+    """Adı verilen motoru oluşturur; ad yoksa KURAN_TTS_MOTORU ortam değişkeni, o da yoksa gTTS"""
+    ad = ad or os.environ.get("KURAN_TTS_MOTORU", GTTSMotoru.ad)
+    if ad not in MOTORLAR:
+        raise ValueError(f"Bilinmeyen TTS motoru: {ad}")
+    return MOTORLAR[ad](ses=ses)
+
+
+def kullanilabilir_motorlar():
+    """Bu sistemde çalışabilecek motorların adlarını döndürür"""
+    return [ad for ad, sinif in MOTORLAR.items() if sinif().kullanilabilir()]
+
+
+def uygun_motor_olustur(ad=None, ses=""):
+    """motor_olustur gibi; istenen motor bilinmiyor ya da bu sistemde çalışmıyorsa ilk kullanılabilir motoru döndürür"""
+    ad = ad or os.environ.get("KURAN_TTS_MOTORU", GTTSMotoru.ad)
+    sinif = MOTORLAR.get(ad)
+    if sinif is not None and sinif(ses=ses).kullanilabilir():
+        return sinif(ses=ses)
+    # Ses (voice) kimliği istenen motora özgü olduğundan yedek motora aktarılmaz
+    return MOTORLAR[(kullanilabilir_motorlar() or [SessizMotor.ad])[0]]()
@@ -1,16 +1,132 @@
+import re
+from functools import lru_cache
 from PyQt5.QtGui import QTextCharFormat, QColor, QTextCursor
 
-def vurgu_ekle(metin, kelime, renk="yellow"):
-    if not kelime:
+# Eşleşmede yok sayılan Arapça hareke karakterleri (normalize_arabic ile aynı aralık)
+_HAREKELER = frozenset(
+    [chr(c) for c in range(0x064B, 0x0660)] + ["\u0670"] + [chr(c) for c in range(0x06D6, 0x06EE)]
+)
+_HTML_VARLIK = re.compile(r'&#?\w+;')
+
+
+def _harf_normalize(harf, duyarli=False):
+    """Tek karakteri Arapça hareke (duyarli False ise Türkçe büyük/küçük harf de) duyarsız hale getirir"""
+    if harf in _HAREKELER:
+        return ""
+    if duyarli:
+        return harf
+    if harf == "İ":
+        return "i"
+    if harf == "I":
+        return "ı"
+    kucuk = harf.lower()
+    return kucuk if len(kucuk) == 1 else harf
+
+
+class _AhoCorasick:
+    """Terim kümesi için Aho-Corasick otomatı; her düğümde biten terim uzunluklarını tutar"""
+
+    def __init__(self, terimler):
+        self.gecis = [{}]
+        self.hata = [0]
+        self.cikis = [()]
+        for terim in terimler:
+            durum = 0
+            for harf in terim:
+                sonraki = self.gecis[durum].get(harf)
+                if sonraki is None:
+                    sonraki = len(self.gecis)
+                    self.gecis[durum][harf] = sonraki
+                    self.gecis.append({})
+                    self.hata.append(0)
+                    self.cikis.append(())
+                durum = sonraki
+            if len(terim) not in self.cikis[durum]:
+                self.cikis[durum] += (len(terim),)
+
+        # Hata bağlantılarını genişlik öncelikli kur
+        kuyruk = list(self.gecis[0].values())
+        for durum in kuyruk:
+            for harf, sonraki in self.gecis[durum].items():
+                kuyruk.append(sonraki)
+                geri = self.hata[durum]
+                while geri and harf not in self.gecis[geri]:
+                    geri = self.hata[geri]
+                hedef = self.gecis[geri].get(harf, 0)
+                self.hata[sonraki] = hedef if hedef != sonraki else 0
+                self.cikis[sonraki] += tuple(u for u in self.cikis[self.hata[sonraki]]
+                                             if u not in self.cikis[sonraki])
+
+    def ilerle(self, durum, harf):
+        while durum and harf not in self.gecis[durum]:
+            durum = self.hata[durum]
+        return self.gecis[durum].get(harf, 0)
+
+
+@lru_cache(maxsize=128)
+def _otomat_olustur(terimler, duyarli=False):
+    normalize = {"".join(_harf_normalize(h, duyarli) for h in t) for t in terimler}
+    return _AhoCorasick(sorted(t for t in normalize if t))
+
+
+def _eslesmeleri_bul(metin, otomat, duyarli=False):
+    """HTML etiketlerinin dışındaki metinde (bas, son) eşleşme aralıklarını tek geçişte bulur"""
+    eslesmeler = []
+    konumlar = []  # normalize edilmiş her harfin orijinal metindeki indeksi
+    durum = 0
+    i, n = 0, len(metin)
+    while i < n:
+        harf = metin[i]
+        if harf == "<":
+            # Etiket içi (ör. style='background-color:...') hiçbir zaman eşleşmez
+            kapanis = metin.find(">", i)
+            i = n if kapanis == -1 else kapanis + 1
+            durum = 0
+            continue
+        if harf == "&":
+            varlik = _HTML_VARLIK.match(metin, i)
+            if varlik:
+                i = varlik.end()
+                durum = 0
+                continue
+        normal = _harf_normalize(harf, duyarli)
+        if normal:
+            konumlar.append(i)
+            durum = otomat.ilerle(durum, normal)
+            for uzunluk in otomat.cikis[durum]:
+                eslesmeler.append((konumlar[-uzunluk], i + 1))
+        i += 1
+    return eslesmeler
+
+
+def vurgu_ekle(metin, kelime, renk="yellow", buyuk_kucuk_duyarli=False):
+    """Terimleri tek geçişte, HTML etiketlerine dokunmadan vurgular.
+
+    Eşleşme Arapça harekelerden, buyuk_kucuk_duyarli False ise Türkçe
+    büyük/küçük harften de bağımsızdır; çakışan eşleşmelerde en soldaki
+    ve en uzun olan seçilir.
+    """
+    if not kelime or not metin:
         return metin
-    if isinstance(kelime, str):
-        return metin.replace(kelime, f"<span style='background-color:{renk}'>{kelime}</span>")
-    else:
-        # kelime listesi ise
-        for k in kelime:
-            metin = metin.replace(k, f"<span style='background-color:{renk}'>{k}</span>")
+    terimler = (kelime,) if isinstance(kelime, str) else tuple(sorted(set(kelime)))
+    otomat = _otomat_olustur(terimler, buyuk_kucuk_duyarli)
+    if len(otomat.gecis) == 1:
         return metin
 
+    parcalar = []
+    son = 0
+    for bas, bitis in sorted(_eslesmeleri_bul(metin, otomat, buyuk_kucuk_duyarli), key=lambda e: (e[0], -e[1])):
+        if bas < son:
+            continue
+        # Son harften sonra gelen harekeleri de vurguya dahil et
+        while bitis < len(metin) and metin[bitis] in _HAREKELER:
+            bitis += 1
+        parcalar.append(metin[son:bas])
+        parcalar.append(f"<span style='background-color:{renk}'>{metin[bas:bitis]}</span>")
+        son = bitis
+    parcalar.append(metin[son:])
+    return "".join(parcalar)
+
 def vurgula(metin, kelime, renk="yellow"):
     return vurgu_ekle(metin, kelime, renk)
 